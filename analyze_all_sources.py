@@ -3,39 +3,164 @@ Unified Sentiment Analysis for YouTube and Reddit Comments
 Analyzes comments from both sources using VADER and generates dashboard data.
 """
 
+import argparse
 import json
+import os
+import pickle
 import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
+
+import numpy as np
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
+try:
+    import orjson
+except ImportError:  # stdlib json is a slower but equivalent fallback
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # large files are then parsed whole like the rest
+    ijson = None
+
+# Below this many files the process pool costs more than it saves
+PARALLEL_MIN_FILES = 4
+
+# Files at least this large are streamed with ijson instead of parsed whole
+STREAM_MIN_BYTES = 64 * 1024 * 1024
+
+# Filename patterns, compiled once at import
+_YT_RE = re.compile(r'comments_([A-Za-z0-9]+)_\d{4}')
+_RD_RE = re.compile(r'reddit_(.+?)_\d{4}')
+_TRAIL_MOVIE_RE = re.compile(r'\s+movie$', re.IGNORECASE)
+
+# Placeholder comments that carry no sentiment
+_SKIP = frozenset(("", "[deleted]", "[removed]"))
+
+# Per-file results from earlier runs, keyed by file identity
+CACHE_FILENAME = ".sentiment_cache.pkl"
+
+# Larger outputs are written compact; indentation only helps human readers.
+# Each movie adds ~7 KB of pretty JSON, so this keeps pretty files under ~4 MB.
+PRETTY_JSON_MAX_MOVIES = 500
+
+# Compound scores keyed by comment text; reposts and boilerplate repeat often
+_SCORE_CACHE = {}
+SCORE_CACHE_MAX = 200_000
+
+# Sentiment label for each code stored in CommentSet.labels
+_LABELS = ("negative", "neutral", "positive")
+
+# VADER compound cutoffs for the positive and negative labels
+POSITIVE_THRESHOLD = 0.05
+NEGATIVE_THRESHOLD = -0.05
+
+
+@dataclass
+class CommentSet:
+    """Analyzed comments stored as parallel arrays rather than a list of dicts."""
+    texts: list = field(default_factory=list)
+    compounds: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+    labels: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.uint8))
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    @classmethod
+    def concat(cls, comment_sets: list) -> "CommentSet":
+        """Join several comment sets end to end, preserving order."""
+        if not comment_sets:
+            return cls()
+        return cls(
+            texts=[text for cs in comment_sets for text in cs.texts],
+            compounds=np.concatenate([cs.compounds for cs in comment_sets]),
+            labels=np.concatenate([cs.labels for cs in comment_sets]),
+        )
+
+    def take(self, indices: np.ndarray) -> "CommentSet":
+        """Return the comments at the given indices as a new set."""
+        return CommentSet(
+            texts=[self.texts[i] for i in indices],
+            compounds=self.compounds[indices],
+            labels=self.labels[indices],
+        )
+
+    def to_dicts(self, indices) -> list:
+        """Materialize the comments at the given indices as dashboard dicts."""
+        return [
+            {
+                "text": self.texts[i],
+                "compound": float(self.compounds[i]),
+                "sentiment": _LABELS[self.labels[i]]
+            }
+            for i in indices
+        ]
+
+
+def load_json(path: Path):
+    """Parse a JSON file, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_json(path: Path, data, pretty: bool = True) -> None:
+    """Serialize data once and write it as UTF-8 JSON in one write."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        payload = orjson.dumps(data, option=option)
+    elif pretty:
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    else:
+        payload = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    path.write_bytes(payload)
+
+
+def split_camel_case(name: str) -> str:
+    """Insert a space at each lower-to-upper boundary (OneBattle -> One Battle)."""
+    out = []
+    prev_lower = False
+    for ch in name:
+        if prev_lower and 'A' <= ch <= 'Z':
+            out.append(' ')
+        out.append(ch)
+        prev_lower = 'a' <= ch <= 'z'
+    return ''.join(out)
+
 
 def extract_movie_name(filename: str, source: str) -> str:
     """Extract movie name from filename."""
     if source == "youtube":
         # Format: comments_MovieName_YYYY-MM-DD.json or comments_YYYY-MM-DD.json
-        match = re.match(r'comments_([A-Za-z0-9]+)_\d{4}', filename)
+        match = _YT_RE.match(filename)
         if match:
             name = match.group(1)
             # Convert camelCase to spaces (e.g., OneBattleAfterAnother -> One Battle After Another)
-            name = re.sub(r'([a-z])([A-Z])', r'\1 \2', name)
+            name = split_camel_case(name)
             return name
         # Fallback for comments_YYYY-MM-DD.json format (no movie name)
         return "One Battle After Another"
     else:
         # Format: reddit_Movie_Name_movie_YYYY-MM-DD.json or reddit_Movie_Name_YYYY-MM-DD.json
-        match = re.match(r'reddit_(.+?)_\d{4}', filename)
+        match = _RD_RE.match(filename)
         if match:
             name = match.group(1).replace('_', ' ')
             # Remove trailing "movie" if present
-            name = re.sub(r'\s+movie$', '', name, flags=re.IGNORECASE)
+            name = _TRAIL_MOVIE_RE.sub('', name)
             return name
     return "Unknown"
 
 
+@lru_cache(maxsize=256)
 def normalize_movie_name(name: str) -> str:
     """Normalize movie names for consistent matching."""
-    name = name.lower().strip()
-    name = re.sub(r'\s+', ' ', name)
+    # split/join collapses whitespace without going through the regex engine
+    name = ' '.join(name.lower().split())
     
     # Handle common variations
     if 'one battle' in name or 'obaa' in name:
@@ -49,108 +174,285 @@ def normalize_movie_name(name: str) -> str:
     return name.title()
 
 
-def classify_sentiment(compound: float) -> str:
-    """Classify sentiment based on VADER compound score."""
-    if compound >= 0.05:
-        return "positive"
-    elif compound <= -0.05:
-        return "negative"
-    return "neutral"
+def classify_sentiments(compounds: np.ndarray) -> np.ndarray:
+    """Classify VADER compound scores, returning indices into _LABELS.
+
+    Scores at or above POSITIVE_THRESHOLD are positive, at or below
+    NEGATIVE_THRESHOLD negative, and anything between neutral.
+    """
+    return (compounds > NEGATIVE_THRESHOLD).astype(np.uint8) + (compounds >= POSITIVE_THRESHOLD)
+
+
+def score_batch(texts: list, analyzer: SentimentIntensityAnalyzer) -> np.ndarray:
+    """Score a batch of comments, returning their VADER compound scores as an array."""
+    polarity_scores = analyzer.polarity_scores
+    cache = _SCORE_CACHE
+    compounds = np.empty(len(texts), dtype=np.float64)
+    
+    for i, text in enumerate(texts):
+        compound = cache.get(text)
+        if compound is None:
+            compound = polarity_scores(text)["compound"]
+            if len(cache) < SCORE_CACHE_MAX:
+                cache[text] = compound
+        compounds[i] = compound
+    
+    return compounds
 
 
-def analyze_comments(comments: list, analyzer: SentimentIntensityAnalyzer) -> list:
+def analyze_comments(comments: list, analyzer: SentimentIntensityAnalyzer) -> CommentSet:
     """Analyze sentiment for a list of comments."""
-    results = []
-    for comment in comments:
-        if not comment or comment == "[deleted]" or comment == "[removed]":
-            continue
-        scores = analyzer.polarity_scores(comment)
-        results.append({
-            "text": comment[:150] + "..." if len(comment) > 150 else comment,
-            "compound": scores["compound"],
-            "sentiment": classify_sentiment(scores["compound"])
-        })
-    return results
-
-
-def process_source(source_dir: Path, source_name: str, analyzer: SentimentIntensityAnalyzer) -> dict:
-    """Process all JSON files from a source directory."""
-    results = {}
-    
-    for json_file in source_dir.glob("*.json"):
-        movie = extract_movie_name(json_file.name, source_name)
-        movie = normalize_movie_name(movie)
-        
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        all_comments = []
-        
-        # Handle commentsByVideo structure (most files)
-        if "commentsByVideo" in data:
-            for video_title, comments in data.get("commentsByVideo", {}).items():
-                all_comments.extend(comments)
-        
-        # Handle posts structure (some Reddit files)
-        elif "posts" in data:
-            posts = data.get("posts", {})
-            # posts can be a dict with post titles as keys
-            if isinstance(posts, dict):
-                for post_title, post_data in posts.items():
-                    if isinstance(post_data, dict) and "comments" in post_data:
-                        all_comments.extend(post_data["comments"])
-            # or a list of post objects
-            elif isinstance(posts, list):
-                for post in posts:
-                    if "comments" in post:
-                        all_comments.extend(post["comments"])
-        
-        analyzed = analyze_comments(all_comments, analyzer)
-        
-        if movie not in results:
-            results[movie] = []
-        results[movie].extend(analyzed)
+    texts = [comment for comment in comments if comment is not None and comment not in _SKIP]
+    compounds = score_batch(texts, analyzer)
+    
+    return CommentSet(
+        texts=[text[:150] + "..." if len(text) > 150 else text for text in texts],
+        compounds=compounds,
+        labels=classify_sentiments(compounds),
+    )
+
+
+def extract_comments(data: dict) -> list:
+    """Collect every comment string from a parsed source file."""
+    # Handle commentsByVideo structure (most files)
+    if "commentsByVideo" in data:
+        return list(chain.from_iterable(data["commentsByVideo"].values()))
+    
+    # Handle posts structure (some Reddit files)
+    posts = data.get("posts")
+    # posts can be a dict with post titles as keys
+    if isinstance(posts, dict):
+        return list(chain.from_iterable(
+            post_data["comments"] for post_data in posts.values()
+            if isinstance(post_data, dict) and "comments" in post_data
+        ))
+    # or a list of post objects
+    if isinstance(posts, list):
+        return list(chain.from_iterable(post["comments"] for post in posts if "comments" in post))
     
-    return results
+    return []
 
 
-def calculate_stats(comments: list) -> dict:
-    """Calculate sentiment statistics from analyzed comments."""
-    if not comments:
-        return {"total": 0, "positive": 0, "negative": 0, "neutral": 0, 
-                "positive_pct": 0, "negative_pct": 0, "neutral_pct": 0, "avg_compound": 0}
+def extract_comments_streaming(f) -> list:
+    """Collect comment strings from an open binary file without building its full tree.
+
+    Mirrors extract_comments: commentsByVideo wins over posts when both exist.
+    """
+    video_comments = []
+    post_comments = []
+    has_videos = False
+    # Key (or "item" for array elements) at each open container level
+    path = []
+    
+    for _, event, value in ijson.parse(f):
+        if event == "map_key":
+            path[-1] = value
+            if value == "commentsByVideo" and len(path) == 1:
+                has_videos = True
+        elif event == "start_map":
+            path.append(None)
+        elif event == "start_array":
+            path.append("item")
+        elif event in ("end_map", "end_array"):
+            path.pop()
+        elif path and path[-1] == "item":
+            # commentsByVideo.<title>.item
+            if len(path) == 3 and path[0] == "commentsByVideo":
+                video_comments.append(value)
+            # posts.<title>.comments.item or posts.item.comments.item
+            elif len(path) == 4 and path[0] == "posts" and path[2] == "comments":
+                post_comments.append(value)
+    
+    return video_comments if has_videos else post_comments
+
+
+def analyze_file(json_file: Path, source_name: str, analyzer: SentimentIntensityAnalyzer) -> tuple[str, CommentSet]:
+    """Analyze a single JSON file, returning its movie name and analyzed comments."""
+    movie = extract_movie_name(json_file.name, source_name)
+    movie = normalize_movie_name(movie)
     
-    total = len(comments)
-    positive = sum(1 for c in comments if c["sentiment"] == "positive")
-    negative = sum(1 for c in comments if c["sentiment"] == "negative")
-    neutral = sum(1 for c in comments if c["sentiment"] == "neutral")
-    avg_compound = sum(c["compound"] for c in comments) / total
+    if ijson is not None and json_file.stat().st_size >= STREAM_MIN_BYTES:
+        with open(json_file, 'rb') as f:
+            comments = extract_comments_streaming(f)
+    else:
+        comments = extract_comments(load_json(json_file))
+    
+    return movie, analyze_comments(comments, analyzer)
+
+
+# Per-worker analyzer, built once by _init_worker when the pool starts
+_WORKER_ANALYZER = None
+
+
+def _init_worker() -> None:
+    """Process-pool initializer: load the VADER lexicon once per worker."""
+    global _WORKER_ANALYZER
+    _WORKER_ANALYZER = SentimentIntensityAnalyzer()
+
+
+def _process_one_file(json_file: Path, source_name: str) -> tuple[str, CommentSet]:
+    """Process-pool task: analyze one file with the worker's analyzer."""
+    return analyze_file(json_file, source_name, _WORKER_ANALYZER)
+
+
+def load_cache(cache_file: Path) -> dict:
+    """Load per-file results saved by a previous run, or an empty cache."""
+    try:
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, EOFError, AttributeError, pickle.UnpicklingError):
+        return {}
+
+
+def save_cache(cache_file: Path, cache: dict) -> None:
+    """Persist per-file results for the next run."""
+    with open(cache_file, 'wb') as f:
+        pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _cache_key(json_file: Path, source_name: str) -> tuple:
+    """Identify a file by name, modification time and size."""
+    stat = json_file.stat()
+    return (source_name, json_file.name, stat.st_mtime_ns, stat.st_size)
+
+
+def process_sources(sources: dict[str, Path], cache: dict | None = None) -> dict[str, dict]:
+    """Process every source directory, fanning files out to a process pool.
+    
+    When a cache dict is given, unchanged files reuse their cached results and
+    the cache is updated in place to hold exactly the files seen this run.
+    """
+    jobs = [
+        (json_file, source_name)
+        for source_name, source_dir in sources.items()
+        for json_file in source_dir.glob("*.json")
+    ]
+    keys = [_cache_key(json_file, source_name) for json_file, source_name in jobs]
+    outputs = [cache.get(key) if cache is not None else None for key in keys]
+    pending = [i for i, output in enumerate(outputs) if output is None]
+    
+    if 0 < len(pending) < PARALLEL_MIN_FILES:
+        analyzer = SentimentIntensityAnalyzer()
+        for i in pending:
+            outputs[i] = analyze_file(*jobs[i], analyzer)
+    elif pending:
+        with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_worker) as executor:
+            futures = {executor.submit(_process_one_file, *jobs[i]): i for i in pending}
+            for future in as_completed(futures):
+                outputs[futures[future]] = future.result()
+    
+    if cache is not None:
+        cache.clear()
+        cache.update(zip(keys, outputs))
+    
+    # Merge in glob order so the output is identical to a sequential run
+    results = {source_name: {} for source_name in sources}
+    for (json_file, source_name), (movie, analyzed) in zip(jobs, outputs):
+        results[source_name].setdefault(movie, []).append(analyzed)
     
     return {
-        "total": total,
-        "positive": positive,
-        "negative": negative,
-        "neutral": neutral,
-        "positive_pct": round(positive / total * 100, 1),
-        "negative_pct": round(negative / total * 100, 1),
-        "neutral_pct": round(neutral / total * 100, 1),
-        "avg_compound": round(avg_compound, 3)
+        source_name: {movie: CommentSet.concat(sets) for movie, sets in source_results.items()}
+        for source_name, source_results in results.items()
     }
 
 
-def get_top_comments(comments: list, n: int = 5) -> dict:
-    """Get top positive and negative comments."""
-    if not comments:
+@dataclass
+class StatsAccum:
+    """Running sentiment totals, mergeable without keeping the comments around."""
+    total: int = 0
+    positive: int = 0
+    negative: int = 0
+    neutral: int = 0
+    sum_compound: float = 0.0
+
+    def update(self, comments: CommentSet) -> "StatsAccum":
+        """Fold a set of analyzed comments into the totals."""
+        negative, neutral, positive = np.bincount(comments.labels, minlength=len(_LABELS)).tolist()
+        self.total += len(comments)
+        self.positive += positive
+        self.negative += negative
+        self.neutral += neutral
+        self.sum_compound += float(comments.compounds.sum())
+        return self
+
+    def __add__(self, other: "StatsAccum") -> "StatsAccum":
+        return StatsAccum(
+            total=self.total + other.total,
+            positive=self.positive + other.positive,
+            negative=self.negative + other.negative,
+            neutral=self.neutral + other.neutral,
+            sum_compound=self.sum_compound + other.sum_compound,
+        )
+
+    def to_dict(self) -> dict:
+        """Render the totals in the dashboard's stats format."""
+        total = self.total
+        if not total:
+            return {"total": 0, "positive": 0, "negative": 0, "neutral": 0, 
+                    "positive_pct": 0, "negative_pct": 0, "neutral_pct": 0, "avg_compound": 0}
+        
+        return {
+            "total": total,
+            "positive": self.positive,
+            "negative": self.negative,
+            "neutral": self.neutral,
+            "positive_pct": round(self.positive / total * 100, 1),
+            "negative_pct": round(self.negative / total * 100, 1),
+            "neutral_pct": round(self.neutral / total * 100, 1),
+            "avg_compound": round(self.sum_compound / total, 3)
+        }
+
+
+def _extreme_indices(compounds: np.ndarray, n: int) -> tuple[np.ndarray, np.ndarray]:
+    """Indices of the n highest and n lowest scores, in position order.
+
+    Ties at the cutoff resolve like a stable descending sort: the highest
+    keep the earliest tied comments and the lowest keep the latest.
+    """
+    if n < len(compounds):
+        # O(N) partial selection of the cutoff values; only the n winners get sorted later
+        high = -np.partition(-compounds, n - 1)[n - 1]
+        low = np.partition(compounds, n - 1)[n - 1]
+        above = np.flatnonzero(compounds > high)
+        below = np.flatnonzero(compounds < low)
+        top = np.union1d(above, np.flatnonzero(compounds == high)[:n - len(above)])
+        low_ties = np.flatnonzero(compounds == low)
+        bottom = np.union1d(below, low_ties[len(low_ties) - (n - len(below)):])
+        return top, bottom
+    everything = np.arange(len(compounds))
+    return everything, everything
+
+
+def get_top_comments(*parts: CommentSet, n: int = 5) -> dict:
+    """Get top positive and negative comments across one or more comment sets."""
+    if len(parts) == 1:
+        comments = parts[0]
+    else:
+        # The overall extremes are among each part's own extremes, so only
+        # those candidates get joined (union1d keeps them in position order)
+        comments = CommentSet.concat([
+            part.take(np.union1d(*_extreme_indices(part.compounds, n))) for part in parts
+        ])
+    
+    if not len(comments):
         return {"positive": [], "negative": []}
     
-    sorted_by_score = sorted(comments, key=lambda x: x["compound"], reverse=True)
+    compounds = comments.compounds
+    top, bottom = _extreme_indices(compounds, n)
+    
+    # Ties break on position, matching a stable descending sort
     return {
-        "positive": sorted_by_score[:n],
-        "negative": sorted_by_score[-n:][::-1]
+        "positive": comments.to_dicts(top[np.lexsort((top, -compounds[top]))]),
+        "negative": comments.to_dicts(bottom[np.lexsort((-bottom, compounds[bottom]))])
     }
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Analyze YouTube and Reddit comment sentiment.")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"Reprocess every file, ignoring and not writing {CACHE_FILENAME}")
+    args = parser.parse_args()
+    
     print("🎬 Sentiment Analysis - All Sources")
     print("=" * 50)
     
@@ -158,14 +460,15 @@ def main():
     youtube_dir = script_dir / "raw_data" / "results" / "youtube"
     reddit_dir = script_dir / "raw_data" / "results" / "reddit"
     
-    analyzer = SentimentIntensityAnalyzer()
-    
-    # Process each source
-    print("\n📺 Processing YouTube comments...")
-    youtube_results = process_source(youtube_dir, "youtube", analyzer)
-    
-    print("🤖 Processing Reddit comments...")
-    reddit_results = process_source(reddit_dir, "reddit", analyzer)
+    # Process both sources in one pass so files share the worker pool
+    print("\n📺🤖 Processing YouTube and Reddit comments...")
+    cache_file = script_dir / CACHE_FILENAME
+    cache = None if args.no_cache else load_cache(cache_file)
+    source_results = process_sources({"youtube": youtube_dir, "reddit": reddit_dir}, cache)
+    if cache is not None:
+        save_cache(cache_file, cache)
+    youtube_results = source_results["youtube"]
+    reddit_results = source_results["reddit"]
     
     # Build dashboard data
     dashboard_data = {
@@ -181,48 +484,48 @@ def main():
     # Get all unique movies
     all_movies = set(youtube_results.keys()) | set(reddit_results.keys())
     
-    # Calculate per-movie stats
-    all_global_comments = []
-    all_youtube_comments = []
-    all_reddit_comments = []
+    # Calculate per-movie stats, keeping only running totals for the global view
+    youtube_totals = StatsAccum()
+    reddit_totals = StatsAccum()
     
     for movie in sorted(all_movies):
-        yt_comments = youtube_results.get(movie, [])
-        rd_comments = reddit_results.get(movie, [])
-        combined = yt_comments + rd_comments
+        # pop so each movie's comments can be freed once it is summarized
+        yt_comments = youtube_results.pop(movie, CommentSet())
+        rd_comments = reddit_results.pop(movie, CommentSet())
         
-        all_global_comments.extend(combined)
-        all_youtube_comments.extend(yt_comments)
-        all_reddit_comments.extend(rd_comments)
+        yt_stats = StatsAccum().update(yt_comments)
+        rd_stats = StatsAccum().update(rd_comments)
+        youtube_totals += yt_stats
+        reddit_totals += rd_stats
         
         movie_data = {
             "name": movie,
             "youtube": {
-                "stats": calculate_stats(yt_comments),
-                "top_comments": get_top_comments(yt_comments, 3)
+                "stats": yt_stats.to_dict(),
+                "top_comments": get_top_comments(yt_comments, n=3)
             },
             "reddit": {
-                "stats": calculate_stats(rd_comments),
-                "top_comments": get_top_comments(rd_comments, 3)
+                "stats": rd_stats.to_dict(),
+                "top_comments": get_top_comments(rd_comments, n=3)
             },
             "combined": {
-                "stats": calculate_stats(combined),
-                "top_comments": get_top_comments(combined, 5)
+                "stats": (yt_stats + rd_stats).to_dict(),
+                "top_comments": get_top_comments(yt_comments, rd_comments, n=5)
             }
         }
         dashboard_data["movies"].append(movie_data)
         
-        print(f"  ✅ {movie}: {len(yt_comments)} YT + {len(rd_comments)} Reddit = {len(combined)} total")
+        print(f"  ✅ {movie}: {len(yt_comments)} YT + {len(rd_comments)} Reddit = {len(yt_comments) + len(rd_comments)} total")
     
     # Global stats
-    dashboard_data["global"]["stats"] = calculate_stats(all_global_comments)
-    dashboard_data["sources"]["youtube"]["stats"] = calculate_stats(all_youtube_comments)
-    dashboard_data["sources"]["reddit"]["stats"] = calculate_stats(all_reddit_comments)
+    dashboard_data["global"]["stats"] = (youtube_totals + reddit_totals).to_dict()
+    dashboard_data["sources"]["youtube"]["stats"] = youtube_totals.to_dict()
+    dashboard_data["sources"]["reddit"]["stats"] = reddit_totals.to_dict()
     
     # Save dashboard data
     output_file = script_dir / "sentiment_dashboard_data.json"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(dashboard_data, f, indent=2, ensure_ascii=False)
+    write_json(output_file, dashboard_data,
+               pretty=len(dashboard_data["movies"]) <= PRETTY_JSON_MAX_MOVIES)
     
     print(f"\n💾 Dashboard data saved to: {output_file}")
     print(f"\n📊 GLOBAL SUMMARY")
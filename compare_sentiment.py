@@ -3,101 +3,156 @@ Movie Sentiment Comparison
 Aggregates and compares sentiment analysis results across multiple movies for visualization.
 """
 
-import pandas as pd
+import csv
+import os
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 from pathlib import Path
 import json
 
+try:
+    import orjson
+except ImportError:  # stdlib json is a slower but equivalent fallback
+    orjson = None
 
-def load_all_results(sentiment_dir: Path) -> dict[str, pd.DataFrame]:
+
+COMPARISON_COLUMNS = ['movie', 'total_comments',
+                      'positive_count', 'negative_count', 'neutral_count',
+                      'positive_pct', 'negative_pct', 'neutral_pct',
+                      'avg_compound', 'median_compound', 'std_compound',
+                      'min_compound', 'max_compound']
+
+
+def load_results(csv_file: Path) -> dict[str, np.ndarray]:
+    """Load the sentiment and compound columns of one result CSV."""
+    sentiments = []
+    compounds = []
+    with open(csv_file, 'r', encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            sentiments.append(row['sentiment'])
+            compounds.append(float(row['compound']))
+    return {
+        'sentiment': np.array(sentiments),
+        'compound': np.array(compounds, dtype=np.float64),
+    }
+
+
+def load_all_results(sentiment_dir: Path) -> dict[str, dict[str, np.ndarray]]:
     """Load all sentiment result CSVs from sentiment_analyzed directory."""
-    results = {}
-    for csv_file in sentiment_dir.glob("sentiment_results_*.csv"):
-        # Extract movie name from filename
-        movie_name = csv_file.stem.replace("sentiment_results_", "")
-        results[movie_name] = pd.read_csv(csv_file)
-    return results
+    csv_files = list(sentiment_dir.glob("sentiment_results_*.csv"))
+    # Extract movie name from filename
+    movie_names = [csv_file.stem.replace("sentiment_results_", "") for csv_file in csv_files]
+    
+    # Files are independent, so overlap their reads
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+        return dict(zip(movie_names, executor.map(load_results, csv_files)))
 
 
-def calculate_movie_stats(df: pd.DataFrame) -> dict:
+def calculate_movie_stats(results: dict[str, np.ndarray]) -> dict:
     """Calculate key statistics for a movie's comments."""
-    total = len(df)
-    
-    positive = len(df[df['sentiment'] == 'Positive'])
-    negative = len(df[df['sentiment'] == 'Negative'])
-    neutral = len(df[df['sentiment'] == 'Neutral'])
+    compounds = results['compound']
+    total = len(compounds)
+    
+    labels, label_counts = np.unique(results['sentiment'], return_counts=True)
+    counts = dict(zip(labels.tolist(), label_counts.tolist()))
+    positive = counts.get('Positive', 0)
+    negative = counts.get('Negative', 0)
+    neutral = counts.get('Neutral', 0)
+    
+    if total == 0:
+        return {
+            'total_comments': 0, 'positive_count': 0, 'negative_count': 0, 'neutral_count': 0,
+            'positive_pct': 0, 'negative_pct': 0, 'neutral_pct': 0,
+            'avg_compound': 0, 'median_compound': 0, 'std_compound': 0,
+            'min_compound': 0, 'max_compound': 0,
+        }
     
     return {
         'total_comments': total,
         'positive_count': positive,
         'negative_count': negative,
         'neutral_count': neutral,
-        'positive_pct': round(positive / total * 100, 1) if total > 0 else 0,
-        'negative_pct': round(negative / total * 100, 1) if total > 0 else 0,
-        'neutral_pct': round(neutral / total * 100, 1) if total > 0 else 0,
-        'avg_compound': round(df['compound'].mean(), 3),
-        'median_compound': round(df['compound'].median(), 3),
-        'std_compound': round(df['compound'].std(), 3),
-        'min_compound': round(df['compound'].min(), 3),
-        'max_compound': round(df['compound'].max(), 3),
+        'positive_pct': round(positive / total * 100, 1),
+        'negative_pct': round(negative / total * 100, 1),
+        'neutral_pct': round(neutral / total * 100, 1),
+        'avg_compound': round(float(compounds.mean()), 3),
+        'median_compound': round(float(np.median(compounds)), 3),
+        'std_compound': round(float(compounds.std(ddof=1)), 3),
+        'min_compound': round(float(compounds.min()), 3),
+        'max_compound': round(float(compounds.max()), 3),
     }
 
 
-def create_comparison_dataframe(all_results: dict[str, pd.DataFrame]) -> pd.DataFrame:
-    """Create a comparison DataFrame with stats for each movie."""
-    comparison_data = []
+def create_comparison_rows(all_results: dict[str, dict[str, np.ndarray]]) -> list[dict]:
+    """Create one comparison row per movie, ordered by average compound score."""
+    comparison_rows = []
     
-    for movie_name, df in all_results.items():
-        stats = calculate_movie_stats(df)
+    for movie_name, results in all_results.items():
+        stats = calculate_movie_stats(results)
         stats['movie'] = movie_name
-        comparison_data.append(stats)
-    
-    # Create DataFrame and reorder columns
-    comparison_df = pd.DataFrame(comparison_data)
-    cols = ['movie', 'total_comments', 
-            'positive_count', 'negative_count', 'neutral_count',
-            'positive_pct', 'negative_pct', 'neutral_pct',
-            'avg_compound', 'median_compound', 'std_compound',
-            'min_compound', 'max_compound']
+        comparison_rows.append({col: stats[col] for col in COMPARISON_COLUMNS})
     
-    return comparison_df[cols].sort_values('avg_compound', ascending=False)
+    return sorted(comparison_rows, key=lambda row: -row['avg_compound'])
 
 
-def create_visualization_data(comparison_df: pd.DataFrame) -> dict:
+def create_visualization_data(comparison_rows: list[dict]) -> dict:
     """Create a JSON structure optimized for visualization libraries."""
+    # Transpose the rows into columns once; everything below reads columns
+    columns = {col: [row[col] for row in comparison_rows] for col in COMPARISON_COLUMNS}
+    movies = columns['movie']
+    
+    def ranked_by(col: str) -> list[str]:
+        order = np.argsort(-np.asarray(columns[col], dtype=np.float64), kind='stable')
+        return [movies[i] for i in order.tolist()]
+    
     return {
-        'movies': comparison_df['movie'].tolist(),
+        'movies': movies,
         'metrics': {
-            'total_comments': comparison_df['total_comments'].tolist(),
-            'positive_pct': comparison_df['positive_pct'].tolist(),
-            'negative_pct': comparison_df['negative_pct'].tolist(),
-            'neutral_pct': comparison_df['neutral_pct'].tolist(),
-            'avg_compound': comparison_df['avg_compound'].tolist(),
+            'total_comments': columns['total_comments'],
+            'positive_pct': columns['positive_pct'],
+            'negative_pct': columns['negative_pct'],
+            'neutral_pct': columns['neutral_pct'],
+            'avg_compound': columns['avg_compound'],
         },
         'sentiment_distribution': [
-            {
-                'movie': row['movie'],
-                'Positive': row['positive_pct'],
-                'Negative': row['negative_pct'],
-                'Neutral': row['neutral_pct']
-            }
-            for _, row in comparison_df.iterrows()
+            {'movie': movie, 'Positive': positive, 'Negative': negative, 'Neutral': neutral}
+            for movie, positive, negative, neutral in zip(
+                movies, columns['positive_pct'], columns['negative_pct'], columns['neutral_pct']
+            )
         ],
         'rankings': {
-            'by_positivity': comparison_df.sort_values('positive_pct', ascending=False)['movie'].tolist(),
-            'by_avg_compound': comparison_df.sort_values('avg_compound', ascending=False)['movie'].tolist(),
-            'by_engagement': comparison_df.sort_values('total_comments', ascending=False)['movie'].tolist(),
+            'by_positivity': ranked_by('positive_pct'),
+            'by_avg_compound': ranked_by('avg_compound'),
+            'by_engagement': ranked_by('total_comments'),
         }
     }
 
 
-def print_comparison_report(comparison_df: pd.DataFrame):
+def write_csv(path: Path, comparison_rows: list[dict]) -> None:
+    """Write the comparison rows as CSV in COMPARISON_COLUMNS order."""
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=COMPARISON_COLUMNS, lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(comparison_rows)
+
+
+def write_json(path: Path, data: dict) -> None:
+    """Write data as pretty-printed UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def print_comparison_report(comparison_rows: list[dict]):
     """Print a formatted comparison report."""
     print("\n" + "="*80)
     print("📊 MOVIE SENTIMENT COMPARISON")
     print("="*80)
     
     print("\n🎬 Overall Rankings (by Average Compound Score):\n")
-    for i, (_, row) in enumerate(comparison_df.iterrows(), 1):
+    for i, row in enumerate(comparison_rows, 1):
         emoji = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else "  "
         print(f"  {emoji} {i}. {row['movie']}")
         print(f"       Avg Score: {row['avg_compound']:.3f} | "
@@ -110,9 +165,9 @@ def print_comparison_report(comparison_df: pd.DataFrame):
     print("💡 KEY INSIGHTS")
     print("-"*80)
     
-    most_positive = comparison_df.loc[comparison_df['positive_pct'].idxmax()]
-    most_negative = comparison_df.loc[comparison_df['negative_pct'].idxmax()]
-    most_engagement = comparison_df.loc[comparison_df['total_comments'].idxmax()]
+    most_positive = max(comparison_rows, key=lambda row: row['positive_pct'])
+    most_negative = max(comparison_rows, key=lambda row: row['negative_pct'])
+    most_engagement = max(comparison_rows, key=lambda row: row['total_comments'])
     
     print(f"\n  🌟 Most Positive Reception: {most_positive['movie']} ({most_positive['positive_pct']}% positive)")
     print(f"  💔 Most Controversial: {most_negative['movie']} ({most_negative['negative_pct']}% negative)")
@@ -135,22 +190,21 @@ def main():
     for movie in all_results.keys():
         print(f"   - {movie}")
     
-    # Create comparison DataFrame
-    comparison_df = create_comparison_dataframe(all_results)
+    # Create comparison rows
+    comparison_rows = create_comparison_rows(all_results)
     
     # Print report
-    print_comparison_report(comparison_df)
+    print_comparison_report(comparison_rows)
     
     # Export comparison CSV to sentiment_analyzed
     csv_path = sentiment_dir / "movie_comparison.csv"
-    comparison_df.to_csv(csv_path, index=False, encoding='utf-8')
+    write_csv(csv_path, comparison_rows)
     print(f"\n💾 Comparison CSV exported to: {csv_path}")
     
     # Export visualization-ready JSON to sentiment_analyzed
-    viz_data = create_visualization_data(comparison_df)
+    viz_data = create_visualization_data(comparison_rows)
     json_path = sentiment_dir / "movie_comparison.json"
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(viz_data, f, indent=2, ensure_ascii=False)
+    write_json(json_path, viz_data)
     print(f"💾 Visualization JSON exported to: {json_path}")
 
 
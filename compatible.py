@@ -5,16 +5,23 @@ Campaign validation on top of VADER results (YouTube/Reddit comments)
 
 Install (if missing):
 pip install pandas scipy vaderSentiment
+pip install pyahocorasick  # optional, faster keyword flags
+pip install pyarrow         # optional, parquet export of the scored comments
 """
 
 import json
+import os
 import re
+import string
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
+import numpy as np
 import pandas as pd
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+from vaderSentiment.vaderSentiment import BOOSTER_DICT, SentiText, SentimentIntensityAnalyzer
 
 # Optional: significance tests
 try:
@@ -23,6 +30,25 @@ try:
 except Exception:
     SCIPY_OK = False
 
+# Optional: faster JSON parsing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: single-pass multi-keyword matching
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional: columnar export of the full scored table
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
 
 # -----------------------------
 # 1) Keyword dictionaries (tweak freely)
@@ -68,15 +94,69 @@ KEYWORDS = {
     ],
 }
 
-# Simple regex normalizer for keyword search
-_WORD_RE = re.compile(r"[^a-z0-9\s']+")
+# Simple translate-table normalizer for keyword search
+class _NormalizeTable(dict):
+    """
+    str.translate table equivalent to re.sub(r"[^a-z0-9\s']+", " ", ...): keeps
+    a-z, 0-9 and apostrophes, maps everything else to a space. Code points outside
+    ASCII are filled in (and memoized) on first sight so translate stays a C loop.
+    """
+    def __missing__(self, code_point: int) -> str:
+        self[code_point] = " "
+        return " "
+
+
+_NORMALIZE_TABLE = _NormalizeTable(
+    {c: (chr(c) if chr(c) in string.ascii_lowercase + string.digits + "'" else " ") for c in range(128)}
+)
 
 
 def normalize_text(s: str) -> str:
-    s = s.lower()
-    s = _WORD_RE.sub(" ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+    # split/join collapses and strips whitespace without a second regex pass
+    return " ".join(s.lower().translate(_NORMALIZE_TABLE).split())
+
+
+# One compiled alternation per keyword group, for when pyahocorasick is missing.
+# Normalized text is pure ASCII, so Unicode-aware matching is never needed.
+_KEYWORD_PATTERNS = {
+    k: re.compile("|".join(re.escape(p) for p in phrases), re.ASCII) for k, phrases in KEYWORDS.items()
+}
+
+
+def _build_keyword_automaton():
+    """
+    One Aho-Corasick automaton over every phrase in KEYWORDS. Each phrase's value
+    is a bitmask of the groups it belongs to (bit i = i-th KEYWORDS group), so a
+    phrase listed in several groups (e.g. "imax") flags all of them.
+    """
+    masks = {}
+    for bit, phrases in enumerate(KEYWORDS.values()):
+        for phrase in phrases:
+            masks[phrase] = masks.get(phrase, 0) | (1 << bit)
+
+    automaton = ahocorasick.Automaton()
+    for phrase, mask in masks.items():
+        automaton.add_word(phrase, mask)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton() if ahocorasick is not None else None
+
+
+def keyword_masks(texts: List[str]) -> np.ndarray:
+    """
+    Scan each normalized text once and return a bitmask of matched KEYWORDS groups.
+    Requires pyahocorasick.
+    """
+    find_all = _KEYWORD_AUTOMATON.iter
+    out = np.zeros(len(texts), dtype=np.int64)
+    for i, text in enumerate(texts):
+        mask = 0
+        for _, phrase_mask in find_all(text):
+            mask |= phrase_mask
+        out[i] = mask
+    return out
 
 
 def contains_any(text: str, phrases: List[str]) -> int:
@@ -92,55 +172,178 @@ def contains_any(text: str, phrases: List[str]) -> int:
 # 2) Load JSON to DataFrame
 # -----------------------------
 def load_comments_json(file_path: str) -> dict:
+    if orjson is not None:
+        with open(file_path, "rb") as f:
+            return orjson.loads(f.read())
     with open(file_path, "r", encoding="utf-8") as f:
         return json.load(f)
 
 
-def json_to_df(data: dict, source: str = "youtube") -> pd.DataFrame:
+def collect_comments(data: dict, movies: List[str], video_titles: List[str], comments: List[str]) -> None:
     """
-    Creates one row per comment with fields:
-    movie, video_title, source, comment
+    Appends one entry per comment to the parallel movie/video_title/comment lists,
+    so many files can feed a single DataFrame construction.
     """
     movie = data.get("query", "UNKNOWN_MOVIE")
-    rows = []
-    for video_title, comments in data.get("commentsByVideo", {}).items():
-        for c in comments:
+    for video_title, video_comments in data.get("commentsByVideo", {}).items():
+        for c in video_comments:
             if not isinstance(c, str):
                 continue
-            rows.append(
-                {
-                    "movie": movie,
-                    "video_title": video_title,
-                    "source": source,
-                    "comment": c,
-                }
-            )
-    return pd.DataFrame(rows)
+            movies.append(movie)
+            video_titles.append(video_title)
+            comments.append(c)
+
+
+def json_to_df(data: dict, source: str = "youtube") -> pd.DataFrame:
+    """
+    Creates one row per comment with fields:
+    movie, video_title, source, comment
+    """
+    movies, video_titles, comments = [], [], []
+    collect_comments(data, movies, video_titles, comments)
+    return pd.DataFrame({"movie": movies, "video_title": video_titles, "source": source, "comment": comments})
 
 
 # -----------------------------
 # 3) VADER + campaign indices
 # -----------------------------
+SCORE_COLUMNS = ["neg", "neu", "pos", "compound"]
+SENTIMENT_LABELS = ["Negative", "Neutral", "Positive"]
+
+
+def sentiment_labels(compound: np.ndarray) -> pd.Categorical:
+    """
+    Bucket compound scores like pd.cut(bins=[-1.0001, -0.05, 0.05, 1.0001]):
+    <= -0.05 Negative, <= 0.05 Neutral, otherwise Positive.
+    """
+    codes = (compound > -0.05).astype(np.int8) + (compound > 0.05)
+    return pd.Categorical.from_codes(codes, categories=SENTIMENT_LABELS, ordered=True)
+
+
+# Below this many comments the process pool costs more than it saves
+PARALLEL_MIN_COMMENTS = 10_000
+
+
+class FastSentimentIntensityAnalyzer(SentimentIntensityAnalyzer):
+    """
+    VADER with a fast path for emoji-free text. Upstream polarity_scores rebuilds
+    every comment character by character to swap emojis for their descriptions;
+    when no character is an emoji that rebuild is the identity, so it is skipped
+    with a single C-level set check. The negation and idiom checks also work on
+    a short token window instead of the whole comment. Scores are identical to
+    the base class.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Upstream matches one character at a time, so only 1-char keys can hit
+        self._emoji_chars = frozenset(k for k in self.emojis if len(k) == 1)
+
+    def polarity_scores(self, text):
+        if not self._emoji_chars.isdisjoint(text):
+            return super().polarity_scores(text)
+
+        # Same steps as upstream polarity_scores after emoji conversion
+        text = text.strip()
+        sentitext = SentiText(text)
+
+        sentiments = []
+        words_and_emoticons = sentitext.words_and_emoticons
+        for i, item in enumerate(words_and_emoticons):
+            valence = 0
+            # check for vader_lexicon words that may be used as modifiers or negations
+            if item.lower() in BOOSTER_DICT:
+                sentiments.append(valence)
+                continue
+            if (i < len(words_and_emoticons) - 1 and item.lower() == "kind" and
+                    words_and_emoticons[i + 1].lower() == "of"):
+                sentiments.append(valence)
+                continue
+
+            sentiments = self.sentiment_valence(valence, sentitext, item, i, sentiments)
+
+        sentiments = self._but_check(words_and_emoticons, sentiments)
+        return self.score_valence(sentiments, text)
+
+    # Upstream lowercases the whole comment on every call to these per-word
+    # checks, but they only look up to 3 tokens back and 2 ahead (i >= 3 for
+    # the idiom check and every look-back index stays >= 0), so a shifted
+    # window gives the same result for a fraction of the work.
+    def _negation_check(self, valence, words_and_emoticons, start_i, i):
+        lo = max(i - 3, 0)
+        return super()._negation_check(valence, words_and_emoticons[lo:i + 1], start_i, i - lo)
+
+    def _special_idioms_check(self, valence, words_and_emoticons, i):
+        lo = i - 3
+        return super()._special_idioms_check(valence, words_and_emoticons[lo:i + 3], i - lo)
+
+
+@lru_cache(maxsize=1)
+def _get_analyzer() -> SentimentIntensityAnalyzer:
+    """Process-wide analyzer, so the VADER lexicon is parsed only once."""
+    return FastSentimentIntensityAnalyzer()
+
+
+def _init_worker() -> None:
+    # Load the lexicon when the worker starts rather than on its first chunk
+    _get_analyzer()
+
+
+def _score_chunk(comments: np.ndarray, analyzer: Optional[SentimentIntensityAnalyzer] = None) -> np.ndarray:
+    """Score comments into an (n, 4) array ordered like SCORE_COLUMNS."""
+    polarity_scores = (analyzer or _get_analyzer()).polarity_scores
+    out = np.empty((len(comments), len(SCORE_COLUMNS)), dtype=np.float64)
+    for i, comment in enumerate(comments):
+        d = polarity_scores(comment)
+        out[i] = (d["neg"], d["neu"], d["pos"], d["compound"])
+    return out
+
+
+def score_comments(comments: np.ndarray, analyzer: SentimentIntensityAnalyzer) -> np.ndarray:
+    """
+    VADER-score every comment, splitting large inputs across a process pool.
+    Pool workers build their own analyzer; `analyzer` is used for the serial path.
+    """
+    if len(comments) < PARALLEL_MIN_COMMENTS:
+        return _score_chunk(comments, analyzer)
+
+    n_workers = os.cpu_count() or 1
+    chunks = np.array_split(comments, n_workers)
+    with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker) as executor:
+        return np.concatenate(list(executor.map(_score_chunk, chunks)))
+
+
 def add_vader(df: pd.DataFrame, analyzer: Optional[SentimentIntensityAnalyzer] = None) -> pd.DataFrame:
-    analyzer = analyzer or SentimentIntensityAnalyzer()
-    scores = df["comment"].apply(analyzer.polarity_scores)
-    df = df.copy()
-    df["neg"] = scores.apply(lambda d: d["neg"])
-    df["neu"] = scores.apply(lambda d: d["neu"])
-    df["pos"] = scores.apply(lambda d: d["pos"])
-    df["compound"] = scores.apply(lambda d: d["compound"])
-    df["sentiment"] = pd.cut(
-        df["compound"],
-        bins=[-1.0001, -0.05, 0.05, 1.0001],
-        labels=["Negative", "Neutral", "Positive"],
-    )
+    analyzer = analyzer or _get_analyzer()
+    # Score each distinct comment once, then broadcast back to every row
+    codes, uniques = pd.factorize(df["comment"])
+    scores = score_comments(np.asarray(uniques, dtype=object), analyzer)
+    # Shallow copy: only new columns are added, so the caller's frame is left
+    # alone without cloning every comment string
+    df = df.copy(deep=False)
+    df[SCORE_COLUMNS] = scores[codes]
+    df["sentiment"] = sentiment_labels(df["compound"].to_numpy())
     return df
 
 
+def normalize_series(comments: pd.Series) -> pd.Series:
+    """normalize_text over a whole column of comments."""
+    return comments.map(normalize_text)
+
+
 def add_campaign_flags(df: pd.DataFrame) -> pd.DataFrame:
-    df = df.copy()
-    for k, phrases in KEYWORDS.items():
-        df[f"kw_{k}"] = df["comment"].apply(lambda x: contains_any(x, phrases))
+    df = df.copy(deep=False)
+    # Flag each distinct comment once, then broadcast back to every row
+    codes, uniques = pd.factorize(df["comment"])
+    norm = normalize_series(pd.Series(uniques, dtype=object))
+    if _KEYWORD_AUTOMATON is not None:
+        # One automaton pass per comment covers every keyword group
+        masks = keyword_masks(norm.tolist())[codes]
+        for bit, k in enumerate(KEYWORDS):
+            df[f"kw_{k}"] = ((masks >> bit) & 1).astype("int8")
+    else:
+        # Fallback: one alternation scan per keyword group
+        for k, pat in _KEYWORD_PATTERNS.items():
+            df[f"kw_{k}"] = norm.str.contains(pat, regex=True).to_numpy(dtype="int8")[codes]
     return df
 
 
@@ -169,12 +372,20 @@ def agg_metrics(df: pd.DataFrame, level: str = "video") -> pd.DataFrame:
     if level == "video":
         group_cols = ["movie", "video_title", "source"]
 
-    agg = df.groupby(group_cols).agg(
+    # int8 indicators let the rates use the built-in mean instead of per-group lambdas
+    sentiment = df["sentiment"]
+    df = df.assign(
+        _is_pos=(sentiment == "Positive").astype("int8"),
+        _is_neg=(sentiment == "Negative").astype("int8"),
+        _is_neu=(sentiment == "Neutral").astype("int8"),
+    )
+
+    agg = df.groupby(group_cols, observed=True).agg(
         n=("comment", "size"),
         avg_compound=("compound", "mean"),
-        pos_rate=("sentiment", lambda s: (s == "Positive").mean()),
-        neg_rate=("sentiment", lambda s: (s == "Negative").mean()),
-        neu_rate=("sentiment", lambda s: (s == "Neutral").mean()),
+        pos_rate=("_is_pos", "mean"),
+        neg_rate=("_is_neg", "mean"),
+        neu_rate=("_is_neu", "mean"),
         intent_rate=("kw_intent_watch", "mean"),
         craft_rate=("kw_craft", "mean"),
         music_rate=("kw_music", "mean"),
@@ -220,7 +431,6 @@ def significance_compare(
         return out
 
     # Effect size: Cohen's d
-    import numpy as np
     pooled = np.sqrt(((a.var(ddof=1) + b.var(ddof=1)) / 2))
     out["cohens_d"] = float((a.mean() - b.mean()) / pooled) if pooled > 0 else 0.0
 
@@ -233,70 +443,93 @@ def significance_compare(
     return out
 
 
+# Inputs to every campaign score, in the column order used by campaign_weights
+SCORE_INPUTS = ["sent_norm", "intent_rate", "family_rate", "craft_rate", "music_rate",
+                "perf_rate", "confusion_rate", "toxicity_rate"]
+CAMPAIGN_SCORES = ["score_heart_family", "score_craft_event", "score_music_listening",
+                   "score_performance_spotlight", "score_reduce_confusion"]
+
+
+def campaign_weights(cfg: CampaignScoreConfig) -> np.ndarray:
+    """
+    (len(CAMPAIGN_SCORES), len(SCORE_INPUTS)) matrix: one row of linear weights per campaign.
+    """
+    col = {name: i for i, name in enumerate(SCORE_INPUTS)}
+    W = np.zeros((len(CAMPAIGN_SCORES), len(SCORE_INPUTS)))
+
+    # Campaign scores: sentiment + intent + signal - friction (mean of confusion/toxicity)
+    for row, signal in enumerate(["family_rate", "craft_rate", "music_rate", "perf_rate"]):
+        W[row, col["sent_norm"]] = cfg.w_sentiment
+        W[row, col["intent_rate"]] = cfg.w_intent
+        W[row, col[signal]] = cfg.w_signal
+        W[row, col["confusion_rate"]] = -cfg.w_friction / 2
+        W[row, col["toxicity_rate"]] = -cfg.w_friction / 2
+
+    # Confusion reduction campaign: we want high sentiment & intent but ALSO high confusion to justify this angle
+    W[4, col["sent_norm"]] = 0.45
+    W[4, col["intent_rate"]] = 0.25
+    W[4, col["confusion_rate"]] = 0.30  # high confusion => more need
+    W[4, col["toxicity_rate"]] = -0.10
+    return W
+
+
 def campaign_prioritization(movie_metrics: pd.DataFrame, cfg: CampaignScoreConfig = CampaignScoreConfig()) -> pd.DataFrame:
     """
     Produces one row per movie with scores for each campaign hypothesis.
     Scores are 0-100-ish (not strict), higher = better fit.
     """
-    m = movie_metrics.copy()
+    m = movie_metrics.copy(deep=False)
 
     # normalize some columns roughly to 0-1 in a stable way
-    # avg_compound in [-1,1] => map to [0,1]
-    m["sent_norm"] = (m["avg_compound"] + 1) / 2
-
-    # rates are in percent already
-    for col in ["intent_rate", "craft_rate", "music_rate", "perf_rate", "family_rate", "confusion_rate", "toxicity_rate"]:
-        m[col + "_n"] = (m[col] / 100.0).clip(0, 1)
-
-    # Campaign scores: sentiment + intent + signal - friction
-    def score(signal_col, friction_cols=("confusion_rate_n", "toxicity_rate_n")):
-        friction = sum(m[c] for c in friction_cols) / len(friction_cols)
-        return (
-            cfg.w_sentiment * m["sent_norm"]
-            + cfg.w_intent * m["intent_rate_n"]
-            + cfg.w_signal * m[signal_col]
-            - cfg.w_friction * friction
-        )
-
-    # Define campaigns
-    m["score_heart_family"] = (score("family_rate_n") * 100).round(2)
-    m["score_craft_event"] = (score("craft_rate_n") * 100).round(2)
-    m["score_music_listening"] = (score("music_rate_n") * 100).round(2)
-    m["score_performance_spotlight"] = (score("perf_rate_n") * 100).round(2)
+    # avg_compound in [-1,1] => map to [0,1]; rates are in percent already
+    X = np.empty((len(m), len(SCORE_INPUTS)))
+    X[:, 0] = (m["avg_compound"].to_numpy(dtype=np.float64) + 1) / 2
+    X[:, 1:] = np.clip(m[SCORE_INPUTS[1:]].to_numpy(dtype=np.float64) / 100.0, 0, 1)
 
-    # Confusion reduction campaign: we want high sentiment & intent but ALSO high confusion to justify this angle
-    m["score_reduce_confusion"] = (
-        (
-            0.45 * m["sent_norm"]
-            + 0.25 * m["intent_rate_n"]
-            + 0.30 * m["confusion_rate_n"]  # high confusion => more need
-            - 0.10 * m["toxicity_rate_n"]
-        ) * 100
-    ).round(2)
+    # All campaigns in one matrix product
+    m[CAMPAIGN_SCORES] = np.round(X @ campaign_weights(cfg).T * 100, 2)
 
     # Keep only relevant columns
     keep = ["movie", "source", "n", "avg_compound",
             "pos_rate", "neg_rate", "intent_rate",
             "family_rate", "craft_rate", "music_rate", "perf_rate",
             "confusion_rate", "toxicity_rate",
-            "score_heart_family", "score_craft_event", "score_music_listening",
-            "score_performance_spotlight", "score_reduce_confusion"]
+            *CAMPAIGN_SCORES]
     return m[keep].sort_values(["source", "score_craft_event"], ascending=[True, False])
 
 
 # -----------------------------
 # 5) End-to-end runner
 # -----------------------------
+def write_scored_comments(df: pd.DataFrame, out: Path, fmt: str = "csv") -> Path:
+    """
+    Export the full per-comment table, the largest output by far.
+    fmt="parquet" writes zstd parquet through pyarrow (categoricals stored as
+    dictionaries); without pyarrow, or with fmt="csv", it falls back to CSV.
+    """
+    if fmt == "parquet":
+        if pq is not None:
+            path = out / "comments_scored_all.parquet"
+            pq.write_table(pa.Table.from_pandas(df, preserve_index=False), path, compression="zstd")
+            return path
+        print("⚠️ pyarrow not installed, writing comments_scored_all as CSV")
+    path = out / "comments_scored_all.csv"
+    df.to_csv(path, index=False, encoding="utf-8")
+    return path
+
+
 def run_validation(
     youtube_json_dir: str,
     reddit_json_dir: Optional[str] = None,
-    out_dir: str = "campaign_validation_out"
+    out_dir: str = "campaign_validation_out",
+    scored_format: str = "csv"
 ):
     """
     Reads all comments_*.json and reddit_*.json files from dirs, computes metrics and exports CSVs.
     - If reddit_json_dir is provided, assumes same JSON schema.
+    - scored_format="parquet" exports the per-comment table as parquet (needs pyarrow).
     """
-    analyzer = SentimentIntensityAnalyzer()
+    analyzer = _get_analyzer()
 
     def load_dir(dir_path: str, source_name: str, pattern: str = "comments_*.json") -> pd.DataFrame:
         p = Path(dir_path)
@@ -304,12 +537,13 @@ def run_validation(
         if not files:
             print(f"⚠️ No files found in {dir_path} with pattern {pattern}")
             return pd.DataFrame(columns=["movie","video_title","source","comment"])
-        dfs = []
+        # Column lists across all files, turned into one DataFrame at the end
+        movies, video_titles, comments = [], [], []
         for f in files:
             print(f"📂 Loading {f.name}...")
             data = load_comments_json(str(f))
-            dfs.append(json_to_df(data, source=source_name))
-        return pd.concat(dfs, ignore_index=True)
+            collect_comments(data, movies, video_titles, comments)
+        return pd.DataFrame({"movie": movies, "video_title": video_titles, "source": source_name, "comment": comments})
 
     df_y = load_dir(youtube_json_dir, "youtube", pattern="comments_*.json")
     df_all = df_y
@@ -322,6 +556,10 @@ def run_validation(
         print("❌ No comments loaded. Exiting.")
         return
 
+    # Low-cardinality string columns as categoricals: smaller frame, groupby on codes
+    for col in ("movie", "video_title", "source"):
+        df_all[col] = df_all[col].astype("category")
+
     print(f"\n✅ Loaded comments: {len(df_all):,} rows (sources: {df_all['source'].unique().tolist()})")
     print(f"   Movies: {df_all['movie'].unique().tolist()}")
 
@@ -338,12 +576,12 @@ def run_validation(
     # Export
     out = Path(out_dir)
     out.mkdir(parents=True, exist_ok=True)
-    df_all.to_csv(out / "comments_scored_all.csv", index=False, encoding="utf-8")
+    scored_path = write_scored_comments(df_all, out, fmt=scored_format)
     video_metrics.to_csv(out / "video_metrics.csv", index=False, encoding="utf-8")
     movie_metrics.to_csv(out / "movie_metrics.csv", index=False, encoding="utf-8")
     prio.to_csv(out / "campaign_prioritization.csv", index=False, encoding="utf-8")
 
-    print(f"\n💾 Exported:\n- {out/'comments_scored_all.csv'}\n- {out/'video_metrics.csv'}\n- {out/'movie_metrics.csv'}\n- {out/'campaign_prioritization.csv'}")
+    print(f"\n💾 Exported:\n- {scored_path}\n- {out/'video_metrics.csv'}\n- {out/'movie_metrics.csv'}\n- {out/'campaign_prioritization.csv'}")
 
     # Quick console view: Top campaigns per source
     for src in prio["source"].unique():
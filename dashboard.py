@@ -39,47 +39,49 @@ for m in markets:
     else:
         main_markets.append(m)
 
+# Count markets as arrays for the expected-wins summary
+award_counts = np.fromiter((m["award_count"] for m in count_markets), dtype=np.int64, count=len(count_markets))
+count_prices = np.fromiter((m["yes_price_cents"] for m in count_markets), dtype=np.int64, count=len(count_markets))
+
 # Create DataFrame for main markets
 df_main = pd.DataFrame(main_markets)
 
-# Extract category names from titles
-def extract_category(title):
-    if "Best Picture" in title:
-        return "Best Picture"
-    elif "Best Director" in title:
-        return "Best Director"
-    elif "Best Actor" in title and "Supporting" not in title:
-        return "Best Actor"
-    elif "Best Actress" in title and "Supporting" not in title:
-        return "Best Actress"
-    elif "Supporting Actor" in title:
-        return "Best Supp. Actor"
-    elif "Supporting Actress" in title:
-        return "Best Supp. Actress"
-    elif "Adapted Screenplay" in title:
-        return "Adapted Screenplay"
-    elif "Cinematography" in title:
-        return "Cinematography"
-    elif "Film Editing" in title:
-        return "Film Editing"
-    elif "Original Score" in title or "Music" in title:
-        return "Original Score"
-    elif "Production Design" in title:
-        return "Production Design"
-    elif "Sound" in title:
-        return "Sound"
-    else:
-        return title.split("win")[1].split("at")[0].strip() if "win" in title else "Other"
-
-def extract_person(subtitle):
-    if "::" in subtitle:
-        return subtitle.split("::")[0].strip()
-    return ""
-
-df_main["category"] = df_main["title"].apply(extract_category)
-df_main["person"] = df_main["subtitle"].apply(extract_person)
+# Category per title: first matching rule wins, in this order
+title = df_main["title"]
+not_supporting = ~title.str.contains("Supporting", regex=False)
+CATEGORY_RULES = [
+    (title.str.contains("Best Picture", regex=False), "Best Picture"),
+    (title.str.contains("Best Director", regex=False), "Best Director"),
+    (title.str.contains("Best Actor", regex=False) & not_supporting, "Best Actor"),
+    (title.str.contains("Best Actress", regex=False) & not_supporting, "Best Actress"),
+    (title.str.contains("Supporting Actor", regex=False), "Best Supp. Actor"),
+    (title.str.contains("Supporting Actress", regex=False), "Best Supp. Actress"),
+    (title.str.contains("Adapted Screenplay", regex=False), "Adapted Screenplay"),
+    (title.str.contains("Cinematography", regex=False), "Cinematography"),
+    (title.str.contains("Film Editing", regex=False), "Film Editing"),
+    (title.str.contains("Original Score|Music", regex=True), "Original Score"),
+    (title.str.contains("Production Design", regex=False), "Production Design"),
+    (title.str.contains("Sound", regex=False), "Sound"),
+]
+# Fallback: the text between "win" and "at", e.g. "Will X win Best Y at the Oscars?"
+fallback = title.str.split("win", n=2, regex=False).str[1].str.split("at", n=1, regex=False).str[0].str.strip()
+fallback = fallback.where(title.str.contains("win", regex=False), "Other")
+
+df_main["category"] = np.select(
+    [cond.to_numpy() for cond, _ in CATEGORY_RULES],
+    [label for _, label in CATEGORY_RULES],
+    default=fallback.to_numpy(dtype=object),
+)
+# Person is whatever precedes "::" in the subtitle, if any
+df_main["person"] = df_main["subtitle"].str.split("::", n=1, regex=False).str[0].str.strip().where(
+    df_main["subtitle"].str.contains("::", regex=False), ""
+)
 df_main["probability"] = df_main["yes_price_cents"] / 100
 
+# Axis label per market: "Category (Person)", or just the category
+person_suffix = np.where(df_main["person"] != "", " (" + df_main["person"] + ")", "")
+df_main["label"] = df_main["category"] + person_suffix
+
 # Sort by probability
 df_main = df_main.sort_values("yes_price_cents", ascending=True)
 
@@ -108,16 +110,14 @@ fig = make_subplots(
 )
 
 # Color scale based on probability
-colors = px.colors.sample_colorscale(
-    "RdYlGn",
-    [p/100 for p in df_main["yes_price_cents"]]
-)
+prices = df_main["yes_price_cents"].to_numpy()
+colors = px.colors.sample_colorscale("RdYlGn", prices / 100)
+price_text = (df_main["yes_price_cents"].astype(str) + "%").tolist()
 
 # -----------------------------------------------------------------------------
 # Chart 1: Win Probability (Horizontal Bar)
 # -----------------------------------------------------------------------------
-labels = [f"{row['category']}" + (f" ({row['person']})" if row['person'] else "")
-          for _, row in df_main.iterrows()]
+labels = df_main["label"].tolist()
 
 fig.add_trace(
     go.Bar(
@@ -125,7 +125,7 @@ fig.add_trace(
         x=df_main["yes_price_cents"],
         orientation="h",
         marker=dict(color=colors),
-        text=[f"{p}%" for p in df_main["yes_price_cents"]],
+        text=price_text,
         textposition="outside",
         name="Win Probability",
         hovertemplate="<b>%{y}</b><br>Probability: %{x}%<extra></extra>"
@@ -137,15 +137,15 @@ fig.add_trace(
 # Chart 2: Trading Volume (Horizontal Bar)
 # -----------------------------------------------------------------------------
 df_volume = df_main.sort_values("volume", ascending=True)
-labels_vol = [f"{row['category']}" + (f" ({row['person']})" if row['person'] else "")
-              for _, row in df_volume.iterrows()]
+volumes = df_volume["volume"].to_numpy()
+labels_vol = df_volume["label"].tolist()
 
 fig.add_trace(
     go.Bar(
         y=labels_vol,
         x=df_volume["volume"],
         orientation="h",
-        marker=dict(color=px.colors.sample_colorscale("Blues", [v/df_volume["volume"].max() for v in df_volume["volume"]])),
+        marker=dict(color=px.colors.sample_colorscale("Blues", volumes / volumes.max())),
         text=[f"{v:,.0f}" for v in df_volume["volume"]],
         textposition="outside",
         name="Volume",
@@ -205,7 +205,7 @@ fig.add_trace(
             color=df_count["yes_price_cents"],
             colorscale="Viridis"
         ),
-        text=[f"{p}%" for p in df_count["yes_price_cents"]],
+        text=(df_count["yes_price_cents"].astype(str) + "%").tolist(),
         textposition="outside",
         name="Award Count Prob",
         hovertemplate="<b>%{x} Awards</b><br>Probability: %{y}%<extra></extra>"
@@ -217,7 +217,7 @@ fig.add_trace(
 # Chart 5: 24h Activity
 # -----------------------------------------------------------------------------
 df_active = df_main[df_main["volume_24h"] > 0].sort_values("volume_24h", ascending=True)
-labels_24h = [f"{row['category']}" for _, row in df_active.iterrows()]
+labels_24h = df_active["category"].tolist()
 
 fig.add_trace(
     go.Bar(
@@ -237,7 +237,7 @@ fig.add_trace(
 # Chart 6: Open Interest Pie
 # -----------------------------------------------------------------------------
 top_oi = df_main.nlargest(6, "open_interest")
-labels_oi = [f"{row['category']}" for _, row in top_oi.iterrows()]
+labels_oi = top_oi["category"].tolist()
 
 fig.add_trace(
     go.Pie(
@@ -302,11 +302,11 @@ for _, row in top_5.iterrows():
 
 print("\n--- EXPECTED OSCAR WINS ---")
 # Calculate expected value from count markets
-expected_wins = sum(m["award_count"] * m["yes_price_cents"] / 100 for m in count_markets)
+expected_wins = float(award_counts @ count_prices) / 100
 print(f"  Expected wins: {expected_wins:.1f} Oscars")
 
 # Most likely outcome
-most_likely = max(count_markets, key=lambda x: x["yes_price_cents"])
+most_likely = count_markets[int(count_prices.argmax())]
 print(f"  Most likely outcome: {most_likely['award_count']} wins ({most_likely['yes_price_cents']}%)")
 
 print("\n--- PRICE vs VOLUME INSIGHT ---")
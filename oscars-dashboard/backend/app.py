@@ -1,13 +1,16 @@
 """FastAPI server for Oscar Markets Dashboard."""
 
+import asyncio
+from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from datetime import datetime, timezone
-from typing import List
+from typing import List, Optional, Tuple
 
+from bootstrap import DEFAULT_RESPONSE_CLASS
 from models import (
     ComparisonResponse,
     MovieComparison,
@@ -20,7 +23,7 @@ from models import (
 
 # Load meme and template routes first (before Kalshi)
 from meme_routes import router as meme_router
-from template_routes import router as template_router
+from template_routes import router as template_router, upload_janitor
 
 # Kalshi client loaded after memes/templates
 from kalshi_client import (
@@ -29,12 +32,28 @@ from kalshi_client import (
     get_key_odds,
     build_head_to_head,
     clear_cache,
+    open_client,
+    close_client,
 )
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One pooled Kalshi connection for the life of the server
+    open_client()
+    # Clean up templates that were uploaded but never finalized
+    janitor = asyncio.create_task(upload_janitor())
+    yield
+    janitor.cancel()
+    await close_client()
+
+
 app = FastAPI(
     title="Oscar Markets Dashboard API",
     description="Real-time Oscar prediction market data from Kalshi",
     version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=DEFAULT_RESPONSE_CLASS,
 )
 
 # Include routers
@@ -51,6 +70,10 @@ TEMPLATES_DIR = Path(__file__).parent.parent.parent / "MemeTemplate"
 if TEMPLATES_DIR.exists():
     app.mount("/templates", StaticFiles(directory=str(TEMPLATES_DIR)), name="templates")
 
+# Last /api/comparison body as (all_markets timestamp, JSON bytes), reused until the
+# underlying Kalshi data changes
+_comparison_cache: Optional[Tuple[str, bytes]] = None
+
 # CORS middleware for frontend
 app.add_middleware(
     CORSMiddleware,
@@ -73,8 +96,12 @@ async def health_check():
 @app.get("/api/comparison", response_model=ComparisonResponse)
 async def get_comparison():
     """Get full comparison data for all movies."""
+    global _comparison_cache
     try:
-        data = fetch_all_oscar_markets()
+        data = await fetch_all_oscar_markets()
+        if _comparison_cache is not None and _comparison_cache[0] == data["timestamp"]:
+            return Response(content=_comparison_cache[1], media_type="application/json")
+
         movies_data = data["movies"]
 
         movies = []
@@ -82,31 +109,33 @@ async def get_comparison():
             markets = movie_info["markets"]
             metrics = calculate_metrics(markets)
 
-            movie = MovieComparison(
+            # Market data comes straight from Kalshi and is already normalized by
+            # kalshi_client, so the models are built without validation
+            movie = MovieComparison.model_construct(
                 name=movie_name,
                 director=movie_info["director"],
                 year=movie_info["year"],
                 markets=[
-                    Market(
+                    Market.model_construct(
                         ticker=m["ticker"],
                         title=m["title"],
-                        subtitle=m.get("subtitle"),
+                        subtitle=m["subtitle"],
                         category=m["category"],
-                        yes_price=m.get("yes_price") or 0,
-                        yes_bid=m.get("yes_bid"),
-                        no_price=m.get("no_price"),
-                        volume=m.get("volume", 0),
-                        volume_24h=m.get("volume_24h"),
-                        open_interest=m.get("open_interest"),
-                        matched_keywords=m.get("matched_keywords", []),
+                        yes_price=m["yes_price"],
+                        yes_bid=m["yes_bid"],
+                        no_price=m["no_price"],
+                        volume=m["volume"],
+                        volume_24h=m["volume_24h"],
+                        open_interest=m["open_interest"],
+                        matched_keywords=m["matched_keywords"],
                     )
                     for m in markets
                 ],
                 metrics=MovieMetrics(**metrics),
-                best_picture_odds=get_key_odds(markets, "Best Picture"),
-                best_director_odds=get_key_odds(markets, "Best Director"),
-                best_actor_odds=get_key_odds(markets, "Best Actor"),
-                best_actress_odds=get_key_odds(markets, "Best Actress"),
+                best_picture_odds=get_key_odds(movie_info["by_category"], "Best Picture"),
+                best_director_odds=get_key_odds(movie_info["by_category"], "Best Director"),
+                best_actor_odds=get_key_odds(movie_info["by_category"], "Best Actor"),
+                best_actress_odds=get_key_odds(movie_info["by_category"], "Best Actress"),
             )
             movies.append(movie)
 
@@ -116,19 +145,20 @@ async def get_comparison():
         # Build head-to-head comparisons
         h2h_data = build_head_to_head(movies_data)
         head_to_head = [
-            HeadToHead(
+            HeadToHead.model_construct(
                 category=h["category"],
                 leader=h["leader"],
                 markets={
-                    name: HeadToHeadMarket(**market_data)
+                    name: HeadToHeadMarket.model_construct(**market_data)
                     for name, market_data in h["markets"].items()
                 },
             )
             for h in h2h_data
         ]
 
-        return ComparisonResponse(
-            timestamp=datetime.now(timezone.utc),
+        response = ComparisonResponse.model_construct(
+            # When the markets were fetched, not when this response was built
+            timestamp=datetime.fromisoformat(data["timestamp"]),
             movies=movies,
             head_to_head=head_to_head,
             summary={
@@ -136,6 +166,9 @@ async def get_comparison():
                 "movies_analyzed": len(movies),
             },
         )
+        body = response.model_dump_json().encode()
+        _comparison_cache = (data["timestamp"], body)
+        return Response(content=body, media_type="application/json")
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -145,7 +178,7 @@ async def get_comparison():
 async def get_movie(movie_name: str):
     """Get detailed data for a specific movie."""
     try:
-        data = fetch_all_oscar_markets()
+        data = await fetch_all_oscar_markets()
         movies_data = data["movies"]
 
         if movie_name not in movies_data:
@@ -172,7 +205,9 @@ async def get_movie(movie_name: str):
 @app.post("/api/refresh")
 async def refresh_data():
     """Force refresh of cached data."""
-    clear_cache()
+    global _comparison_cache
+    await clear_cache()
+    _comparison_cache = None
     return {"status": "cache cleared", "timestamp": datetime.now(timezone.utc).isoformat()}
 
 
@@ -0,0 +1,27 @@
+"""One-time process setup shared by the route modules and the worker.
+
+Loads .env and puts oscars-memes on sys.path so `llm_pipeline` resolves.
+Import it before anything that reads the environment or imports llm_pipeline.
+"""
+
+import importlib.util
+import os
+import sys
+from pathlib import Path
+
+from dotenv import load_dotenv
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+MEMES_DIR = Path(__file__).parent.parent.parent / "oscars-memes"
+
+# Load environment variables from .env file, unless a parent process already did
+if not os.environ.get("_DOTENV_LOADED"):
+    load_dotenv()
+    os.environ["_DOTENV_LOADED"] = "1"
+
+# Add oscars-memes to path for imports
+if str(MEMES_DIR) not in sys.path:
+    sys.path.insert(0, str(MEMES_DIR))
+
+# Response class for the app and its routers; orjson serializes faster when installed
+DEFAULT_RESPONSE_CLASS = ORJSONResponse if importlib.util.find_spec("orjson") is not None else JSONResponse
@@ -0,0 +1,171 @@
+"""Storage for template processing jobs.
+
+Jobs live in Redis when REDIS_URL is set, so every uvicorn worker sees the
+same status. Otherwise (or with JOB_STORE=memory) they are kept in process
+memory, which is fine for a single dev server.
+"""
+
+import json
+import os
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+# Optional: shared job storage across workers
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+# Jobs (and their processing results) expire after a day
+JOB_TTL_SECONDS = int(os.getenv("JOB_TTL_SECONDS", str(24 * 60 * 60)))
+
+# Fields holding datetimes, restored from ISO strings when read back from Redis
+DATETIME_FIELDS = ("created_at", "updated_at")
+
+# Updates an existing job hash and refreshes both keys' TTL; unknown or
+# expired jobs are left alone rather than recreated as partial hashes.
+# KEYS: job hash, result key. ARGV: ttl, encoded result or "", field/value pairs.
+_UPDATE_SCRIPT = """
+if redis.call("EXISTS", KEYS[1]) == 0 then
+    return 0
+end
+if #ARGV > 2 then
+    redis.call("HSET", KEYS[1], unpack(ARGV, 3))
+end
+redis.call("EXPIRE", KEYS[1], ARGV[1])
+if ARGV[2] ~= "" then
+    redis.call("SET", KEYS[2], ARGV[2], "EX", ARGV[1])
+else
+    redis.call("EXPIRE", KEYS[2], ARGV[1])
+end
+return 1
+"""
+
+
+class InMemoryJobStore:
+    """Job store backed by a process-local dict.
+
+    Like the Redis store, a job expires ttl seconds after its last write.
+    """
+
+    def __init__(self, ttl: int = JOB_TTL_SECONDS):
+        self.ttl = ttl
+        self._jobs: Dict[str, tuple[float, Dict[str, Any]]] = {}
+
+    def _prune(self) -> None:
+        """Drop expired jobs."""
+        now = time.monotonic()
+        expired = [job_id for job_id, (expires, _) in self._jobs.items() if expires <= now]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    async def create(self, job_id: str, fields: Dict[str, Any]) -> None:
+        """Store a new job."""
+        self._prune()
+        self._jobs[job_id] = (time.monotonic() + self.ttl, dict(fields))
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the job's fields, or None if unknown or expired."""
+        entry = self._jobs.get(job_id)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return dict(entry[1])
+
+    async def update(self, job_id: str, /, **fields: Any) -> None:
+        """Overwrite some of the job's fields and push out its expiry.
+
+        Unknown or expired jobs are ignored.
+        """
+        entry = self._jobs.get(job_id)
+        now = time.monotonic()
+        if entry is not None and entry[0] > now:
+            entry[1].update(fields)
+            self._jobs[job_id] = (now + self.ttl, entry[1])
+
+    async def prune(self) -> None:
+        """Drop expired jobs now instead of waiting for the next create."""
+        self._prune()
+
+
+class RedisJobStore:
+    """Job store backed by Redis.
+
+    Status fields go in the hash `job:{id}`, one JSON value per field. The
+    processing result, which can be large, is a separate `job:{id}:result`
+    key. Both expire after the TTL.
+    """
+
+    def __init__(self, url: str, ttl: int = JOB_TTL_SECONDS):
+        self.ttl = ttl
+        self.redis = aioredis.from_url(url)
+        self._update_script = self.redis.register_script(_UPDATE_SCRIPT)
+
+    @staticmethod
+    def _encode(value: Any) -> str:
+        return json.dumps(value, default=lambda v: v.isoformat() if isinstance(v, datetime) else str(v))
+
+    async def create(self, job_id: str, fields: Dict[str, Any]) -> None:
+        """Store a new job."""
+        key = f"job:{job_id}"
+        fields = dict(fields)
+        result = fields.pop("result", None)
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping={name: self._encode(value) for name, value in fields.items()})
+            pipe.expire(key, self.ttl)
+            if result is not None:
+                pipe.set(f"{key}:result", self._encode(result), ex=self.ttl)
+            await pipe.execute()
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return the job's fields, or None if unknown or expired."""
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.hgetall(f"job:{job_id}")
+            pipe.get(f"job:{job_id}:result")
+            raw, result = await pipe.execute()
+
+        if not raw:
+            return None
+
+        job = {key.decode(): json.loads(value) for key, value in raw.items()}
+        for name in DATETIME_FIELDS:
+            if job.get(name):
+                job[name] = datetime.fromisoformat(job[name])
+        job["result"] = json.loads(result) if result else None
+        return job
+
+    async def update(self, job_id: str, /, **fields: Any) -> None:
+        """Overwrite some of the job's fields and refresh its TTL.
+
+        Unknown or expired jobs are ignored.
+        """
+        key = f"job:{job_id}"
+        result = fields.pop("result", None)
+
+        args = [self.ttl, self._encode(result) if result is not None else ""]
+        for name, value in fields.items():
+            args += [name, self._encode(value)]
+        await self._update_script(keys=[key, f"{key}:result"], args=args)
+
+    async def prune(self) -> None:
+        """Nothing to do: Redis expires job keys itself."""
+
+
+def get_job_store():
+    """Pick the job store from the environment.
+
+    Uses Redis when REDIS_URL is set and the redis package is installed,
+    unless JOB_STORE=memory forces the in-process store.
+    """
+    url = os.getenv("REDIS_URL")
+    if url and os.getenv("JOB_STORE", "").lower() != "memory":
+        if aioredis is not None:
+            print("Using Redis job store")
+            return RedisJobStore(url)
+        print("Using in-memory job store: redis package not installed")
+    return InMemoryJobStore()
+
+
+# Shared by the API routes and the worker
+job_store = get_job_store()
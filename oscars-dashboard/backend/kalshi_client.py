@@ -1,24 +1,66 @@
 """Kalshi API client for fetching Oscar prediction markets."""
 
-import requests
+import asyncio
+import importlib.util
 import re
-import time
 import json
+import time
 import os
+import shutil
+import uuid
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Awaitable, Tuple, AsyncIterator
 from datetime import datetime, timezone, timedelta
 from functools import lru_cache
 
+import httpx
+
+# Optional: single-pass multi-keyword matching
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional: faster JSON for the file cache
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 BASE_URL = "https://api.elections.kalshi.com/trade-api/v2"
 
 # Cache configuration
 CACHE_TTL_MINUTES = int(os.getenv("CACHE_TTL_MINUTES", "5"))
 CACHE_TTL = timedelta(minutes=CACHE_TTL_MINUTES)
+# Past the TTL, all_markets is still served for this long while it refreshes in the background
+STALE_GRACE = timedelta(minutes=int(os.getenv("CACHE_STALE_GRACE_MINUTES", str(CACHE_TTL_MINUTES))))
+# Same limits in seconds, for comparisons against time.monotonic()
+CACHE_TTL_SECONDS = CACHE_TTL.total_seconds()
+CACHE_MAX_AGE_SECONDS = (CACHE_TTL + STALE_GRACE).total_seconds()
+
+# Concurrent requests allowed against the Kalshi API (rate limiting)
+MAX_CONCURRENT_REQUESTS = 5
 
-# In-memory cache
-_cache: Dict[str, Any] = {}
-_cache_timestamps: Dict[str, datetime] = {}
+# HTTP/2 needs the h2 package (pip install "httpx[http2]")
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Shared connection pool, opened by the app at startup (see open_client)
+_client: Optional[httpx.AsyncClient] = None
+
+# Markets per page (Kalshi's maximum), so most series fit in a single request
+MARKETS_PAGE_LIMIT = 1000
+
+# In-memory cache: key -> (value, time.monotonic() when stored), least recently used first
+CACHE_MAX_ENTRIES = 128
+_cache: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+
+# One lock per cache key, so concurrent misses trigger a single upstream fetch
+_locks: Dict[str, asyncio.Lock] = {}
+
+# Background refreshes in flight (held so they are not garbage collected)
+_refresh_tasks = set()
 
 # File-based persistent cache
 CACHE_DIR = Path(__file__).parent / "cache"
@@ -68,23 +110,28 @@ MOVIES = {
 }
 
 
+def _json_dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, default=str)
+    return json.dumps(value, default=str).encode()
+
+
+def _json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def _get_file_cache(key: str) -> Optional[Any]:
-    """Load from file cache if valid."""
+    """Load from file cache if valid. A cache file's age is its modification time."""
     cache_file = CACHE_DIR / f"{key}.json"
-    meta_file = CACHE_DIR / "cache_metadata.json"
-
-    if not cache_file.exists():
-        return None
 
     try:
-        meta = json.loads(meta_file.read_text()) if meta_file.exists() else {}
-        timestamp_str = meta.get(key)
-        if timestamp_str:
-            timestamp = datetime.fromisoformat(timestamp_str)
-            if datetime.now(timezone.utc) - timestamp < CACHE_TTL:
-                return json.loads(cache_file.read_text())
-    except (json.JSONDecodeError, ValueError):
-        pass
+        written_at = datetime.fromtimestamp(cache_file.stat().st_mtime, tz=timezone.utc)
+        if datetime.now(timezone.utc) - written_at < CACHE_TTL:
+            return _json_loads(cache_file.read_bytes())
+    except (OSError, ValueError):
+        pass  # Missing or unreadable
 
     return None
 
@@ -92,223 +139,450 @@ def _get_file_cache(key: str) -> Optional[Any]:
 def _set_file_cache(key: str, value: Any) -> None:
     """Save to file cache."""
     cache_file = CACHE_DIR / f"{key}.json"
-    meta_file = CACHE_DIR / "cache_metadata.json"
+    tmp_file = cache_file.with_name(f"{cache_file.name}.tmp")
 
     try:
-        cache_file.write_text(json.dumps(value, default=str))
-
-        meta = json.loads(meta_file.read_text()) if meta_file.exists() else {}
-        meta[key] = datetime.now(timezone.utc).isoformat()
-        meta_file.write_text(json.dumps(meta))
+        # Write then rename, so readers never see a half-written file
+        tmp_file.write_bytes(_json_dumps(value))
+        os.replace(tmp_file, cache_file)
     except (OSError, TypeError):
         pass  # Silently fail file cache writes
 
 
-def _get_cached(key: str) -> Optional[Any]:
-    """Get cached value from memory or file."""
+def _get_cached(key: str) -> Tuple[Optional[Any], bool]:
+    """
+    Get cached value from memory or file, as (value, is_stale).
+    Stale values are past CACHE_TTL but within STALE_GRACE; older ones are not returned.
+    """
     # Try memory first
-    if key in _cache and key in _cache_timestamps:
-        if datetime.now(timezone.utc) - _cache_timestamps[key] < CACHE_TTL:
-            return _cache[key]
+    entry = _cache.get(key)
+    if entry is not None:
+        value, stored_at = entry
+        age = time.monotonic() - stored_at
+        if age < CACHE_MAX_AGE_SECONDS:
+            _cache.move_to_end(key)
+            return value, age >= CACHE_TTL_SECONDS
 
     # Try file cache
     file_data = _get_file_cache(key)
     if file_data:
         # Warm memory cache
-        _cache[key] = file_data
-        _cache_timestamps[key] = datetime.now(timezone.utc)
-        return file_data
+        _set_memory_cache(key, file_data)
+        return file_data, False
 
-    return None
+    return None, False
+
+
+def _set_memory_cache(key: str, value: Any) -> None:
+    """Store in memory, evicting the least recently used entry past CACHE_MAX_ENTRIES."""
+    _cache[key] = (value, time.monotonic())
+    _cache.move_to_end(key)
+    if len(_cache) > CACHE_MAX_ENTRIES:
+        _cache.popitem(last=False)
 
 
 def _set_cache(key: str, value: Any) -> None:
     """Set cache in memory and file."""
-    _cache[key] = value
-    _cache_timestamps[key] = datetime.now(timezone.utc)
+    _set_memory_cache(key, value)
     _set_file_cache(key, value)
 
 
-def fetch_oscar_series() -> List[Dict]:
-    """Fetch all Oscar-related series from Kalshi."""
-    cached = _get_cached("oscar_series")
-    if cached:
+async def _get_or_fetch(key: str, loader: Callable[[], Awaitable[Any]], serve_stale: bool = False) -> Any:
+    """
+    Return the cached value for key, or run loader to fetch it (loader caches its own
+    result). Concurrent misses on the same key wait for one loader instead of each
+    hitting Kalshi. With serve_stale, a stale value is returned immediately and
+    refreshed in the background.
+    """
+    cached, stale = _get_cached(key)
+    if cached and (serve_stale or not stale):
+        if stale:
+            _schedule_refresh(key, loader)
         return cached
 
-    url = f"{BASE_URL}/series"
-    try:
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        data = response.json()
-
-        all_series = data.get("series", [])
-        oscar_series = [
-            {
-                "ticker": s.get("ticker"),
-                "title": s.get("title"),
-                "category": s.get("category"),
-            }
-            for s in all_series
-            if "oscar" in s.get("title", "").lower()
-        ]
+    async with _locks.setdefault(key, asyncio.Lock()):
+        # Filled by another coroutine while we waited for the lock
+        cached, stale = _get_cached(key)
+        if cached and not stale:
+            return cached
+        return await loader()
+
+
+def _schedule_refresh(key: str, loader: Callable[[], Awaitable[Any]]) -> None:
+    """Refresh key in the background, unless a fetch for it is already running."""
+    lock = _locks.setdefault(key, asyncio.Lock())
+    if lock.locked():
+        return
+
+    async def refresh():
+        async with lock:
+            cached, stale = _get_cached(key)
+            if cached and not stale:
+                return
+            try:
+                await loader()
+            except Exception:
+                pass  # Keep serving the stale value; the next request retries
+
+    task = asyncio.create_task(refresh())
+    _refresh_tasks.add(task)
+    task.add_done_callback(_refresh_tasks.discard)
+
+
+def _new_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        base_url=BASE_URL,
+        http2=HTTP2_AVAILABLE,
+        timeout=30,
+        limits=httpx.Limits(max_keepalive_connections=20),
+    )
+
+
+def open_client() -> httpx.AsyncClient:
+    """Open the shared Kalshi client, reused (keep-alive, HTTP/2) by every fetch."""
+    global _client
+    if _client is None:
+        _client = _new_client()
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared Kalshi client."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+@asynccontextmanager
+async def _client_session() -> AsyncIterator[httpx.AsyncClient]:
+    """The shared client when the app has opened one, else a client for this fetch only."""
+    if _client is not None:
+        yield _client
+        return
+    async with _new_client() as client:
+        yield client
+
+
+async def _fetch_json(
+    client: httpx.AsyncClient,
+    limit: asyncio.Semaphore,
+    path: str,
+    params: Optional[Dict[str, Any]] = None,
+    max_retries: int = 3,
+) -> Optional[Dict]:
+    """GET a Kalshi endpoint with exponential backoff. Returns None if every attempt fails."""
+    for attempt in range(max_retries):
+        try:
+            async with limit:
+                response = await client.get(path, params=params)
+            response.raise_for_status()
+            return response.json()
+        except (httpx.HTTPError, ValueError):  # ValueError: non-JSON body, e.g. a gateway page
+            if attempt < max_retries - 1:
+                await asyncio.sleep(2 ** attempt)
+    return None
+
+
+async def fetch_oscar_series(client: httpx.AsyncClient, limit: asyncio.Semaphore) -> List[Dict]:
+    """Fetch all Oscar-related series from Kalshi."""
+    return await _get_or_fetch("oscar_series", lambda: _load_oscar_series(client, limit))
 
-        _set_cache("oscar_series", oscar_series)
-        return oscar_series
 
-    except requests.exceptions.RequestException:
+async def _load_oscar_series(client: httpx.AsyncClient, limit: asyncio.Semaphore) -> List[Dict]:
+    data = await _fetch_json(client, limit, "/series")
+    if data is None:
         return []
 
+    all_series = data.get("series", [])
+    oscar_series = [
+        {
+            "ticker": s.get("ticker"),
+            "title": s.get("title"),
+            "category": s.get("category"),
+        }
+        for s in all_series
+        if "oscar" in s.get("title", "").lower()
+    ]
+
+    _set_cache("oscar_series", oscar_series)
+    return oscar_series
 
-def fetch_markets_for_series(series_ticker: str, max_retries: int = 3) -> List[Dict]:
+
+async def fetch_markets_for_series(
+    client: httpx.AsyncClient,
+    limit: asyncio.Semaphore,
+    series_ticker: str,
+    max_retries: int = 3,
+) -> List[Dict]:
     """Fetch all open markets for a series ticker."""
     cache_key = f"markets_{series_ticker}"
-    cached = _get_cached(cache_key)
-    if cached:
-        return cached
-
+    return await _get_or_fetch(
+        cache_key,
+        lambda: _load_markets_for_series(client, limit, series_ticker, cache_key, max_retries),
+    )
+
+
+async def _load_markets_for_series(
+    client: httpx.AsyncClient,
+    limit: asyncio.Semaphore,
+    series_ticker: str,
+    cache_key: str,
+    max_retries: int,
+) -> List[Dict]:
     markets = []
     cursor = None
 
     while True:
-        url = f"{BASE_URL}/markets?series_ticker={series_ticker}&status=open"
+        params = {"series_ticker": series_ticker, "status": "open", "limit": MARKETS_PAGE_LIMIT}
         if cursor:
-            url += f"&cursor={cursor}"
+            params["cursor"] = cursor
 
-        for attempt in range(max_retries):
-            try:
-                response = requests.get(url, timeout=30)
-                response.raise_for_status()
-                data = response.json()
+        data = await _fetch_json(client, limit, "/markets", params, max_retries)
+        if data is None:
+            # Partial result, not cached so the next call retries
+            return markets
+
+        markets.extend(data.get("markets", []))
+
+        cursor = data.get("cursor")
+        if not cursor:
+            _set_cache(cache_key, markets)
+            return markets
 
-                batch_markets = data.get("markets", [])
-                markets.extend(batch_markets)
 
-                cursor = data.get("cursor")
-                if not cursor:
-                    _set_cache(cache_key, markets)
-                    return markets
-                break
+# Maximal runs of word characters: a keyword made only of word characters matches
+# with \b on both sides exactly when it equals one of these runs
+_WORD_RUN_RE = re.compile(r"\w+")
 
-            except requests.exceptions.RequestException:
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)
-                else:
-                    return markets
 
-    return markets
+def prepare_keywords(keywords: List[str]) -> List[Tuple[str, str, bool, Optional[re.Pattern]]]:
+    """
+    (keyword, lowercased keyword, is_word, pattern) per keyword. Short keywords
+    (4 chars or less) must match as whole words: if they are a single word that is a
+    lookup in the text's word set (is_word), otherwise a compiled \b pattern.
+    Longer keywords match as substrings.
+    """
+    prepared = []
+    for keyword in keywords:
+        kw_lower = keyword.lower()
+        is_word, pattern = False, None
+        if len(keyword) <= 4:
+            if _WORD_RUN_RE.fullmatch(kw_lower):
+                is_word = True
+            else:
+                pattern = re.compile(r'\b' + re.escape(kw_lower) + r'\b')
+        prepared.append((keyword, kw_lower, is_word, pattern))
+    return prepared
+
+
+def _match_prepared(text_lower: str, words: set, prepared: List[Tuple[str, str, bool, Optional[re.Pattern]]]) -> List[str]:
+    matched = []
+    for keyword, kw_lower, is_word, pattern in prepared:
+        if is_word:
+            hit = kw_lower in words
+        elif pattern is not None:
+            hit = pattern.search(text_lower) is not None
+        else:
+            hit = kw_lower in text_lower
+        if hit:
+            matched.append(keyword)
+    return matched
 
 
 def match_keywords(text: str, keywords: List[str]) -> List[str]:
     """Check if text matches any keywords."""
     if not text:
         return []
-
-    matched = []
     text_lower = text.lower()
+    return _match_prepared(text_lower, set(_WORD_RUN_RE.findall(text_lower)), prepare_keywords(keywords))
 
-    for keyword in keywords:
-        if len(keyword) <= 4:
-            pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
-            if re.search(pattern, text_lower):
-                matched.append(keyword)
-        else:
-            if keyword.lower() in text_lower:
-                matched.append(keyword)
 
-    return matched
+# Lowercased keywords and compiled patterns per movie, built once at import
+MOVIE_KEYWORDS = {movie: prepare_keywords(info["keywords"]) for movie, info in MOVIES.items()}
+
+
+def _build_any_keyword_re(movies: Dict[str, Dict]) -> re.Pattern:
+    """One alternation over every movie's keywords, with match_keywords' boundary rules."""
+    alternatives = {}
+    for movie_info in movies.values():
+        for keyword in movie_info["keywords"]:
+            escaped = re.escape(keyword.lower())
+            alternatives[r'\b' + escaped + r'\b' if len(keyword) <= 4 else escaped] = None
+    return re.compile("|".join(alternatives))
+
+
+# True for a text exactly when at least one movie has a matching keyword. Scanning
+# once in the regex engine rules out most markets before any per-keyword work. It is
+# only a filter: finditer would skip overlapping keywords such as "DiCaprio" inside
+# "Leonardo DiCaprio".
+ANY_KEYWORD_RE = _build_any_keyword_re(MOVIES)
+
+
+def _is_word_char(ch: str) -> bool:
+    """Same notion of a word character as the regex \\b in match_keywords."""
+    return ch.isalnum() or ch == "_"
+
+
+def build_keyword_automaton(movies: Dict[str, Dict]):
+    """Aho-Corasick automaton over every movie's lowercased keywords, for match_movies."""
+    automaton = ahocorasick.Automaton()
+    for movie_name, movie_info in movies.items():
+        for idx, keyword in enumerate(movie_info["keywords"]):
+            kw_lower = keyword.lower()
+            # Keywords differing only in case (or shared by movies) share one entry
+            entries = automaton.get(kw_lower, [])
+            entries.append((movie_name, idx, keyword, len(keyword) <= 4))
+            automaton.add_word(kw_lower, entries)
+    automaton.make_automaton()
+    return automaton
+
+
+# Built once at import
+KEYWORD_AUTOMATON = build_keyword_automaton(MOVIES) if ahocorasick is not None else None
+
+
+def match_movies(text: str) -> Dict[str, List[str]]:
+    """
+    Run match_keywords for every movie in one pass over the text.
+    Returns {movie: matched keywords in list order}, only for movies that matched.
+    """
+    if not text:
+        return {}
+
+    text_lower = text.lower()
+
+    if KEYWORD_AUTOMATON is None:
+        if not ANY_KEYWORD_RE.search(text_lower):
+            return {}
+        words = set(_WORD_RUN_RE.findall(text_lower))
+        matches = {}
+        for movie_name, prepared in MOVIE_KEYWORDS.items():
+            matched = _match_prepared(text_lower, words, prepared)
+            if matched:
+                matches[movie_name] = matched
+        return matches
+
+    found: Dict[str, Dict[int, str]] = {}
+    for end, entries in KEYWORD_AUTOMATON.iter(text_lower):
+        for movie_name, idx, keyword, whole_word in entries:
+            movie_found = found.setdefault(movie_name, {})
+            if idx in movie_found:
+                continue
+            if whole_word:
+                # Short keywords need word boundaries on both sides
+                start = end - len(keyword) + 1
+                if start > 0 and _is_word_char(text_lower[start - 1]):
+                    continue
+                if end + 1 < len(text_lower) and _is_word_char(text_lower[end + 1]):
+                    continue
+            movie_found[idx] = keyword
+
+    # Report movies in MOVIES order, keywords in list order
+    return {
+        movie_name: [found[movie_name][idx] for idx in sorted(found[movie_name])]
+        for movie_name in MOVIES
+        if found.get(movie_name)
+    }
 
 
+# (needle, category, unless) checked in order: the first needle found in the
+# title wins, unless the title also contains `unless`
+CATEGORY_RULES = (
+    ("Best Picture", "Best Picture", None),
+    ("Best Director", "Best Director", None),
+    ("Best Actor", "Best Actor", "Supporting"),
+    ("Best Actress", "Best Actress", "Supporting"),
+    ("Supporting Actor", "Supporting Actor", None),
+    ("Supporting Actress", "Supporting Actress", None),
+    ("Original Screenplay", "Original Screenplay", None),
+    ("Adapted Screenplay", "Adapted Screenplay", None),
+    ("Screenplay", "Screenplay", None),
+    ("Score", "Original Score", None),
+    ("Music", "Original Score", None),
+    ("Cinematography", "Cinematography", None),
+    ("Editing", "Film Editing", None),
+    ("Visual Effects", "Visual Effects", None),
+    ("Production Design", "Production Design", None),
+    ("Costume", "Costume Design", None),
+    ("Makeup", "Makeup", None),
+    ("Sound", "Sound", None),
+    ("Song", "Original Song", None),
+    ("How many", "Total Wins", None),
+)
+
+
+@lru_cache(maxsize=4096)
 def extract_category(title: str) -> str:
     """Extract Oscar category from market title."""
-    if "Best Picture" in title:
-        return "Best Picture"
-    elif "Best Director" in title:
-        return "Best Director"
-    elif "Best Actor" in title and "Supporting" not in title:
-        return "Best Actor"
-    elif "Best Actress" in title and "Supporting" not in title:
-        return "Best Actress"
-    elif "Supporting Actor" in title:
-        return "Supporting Actor"
-    elif "Supporting Actress" in title:
-        return "Supporting Actress"
-    elif "Original Screenplay" in title:
-        return "Original Screenplay"
-    elif "Adapted Screenplay" in title:
-        return "Adapted Screenplay"
-    elif "Screenplay" in title:
-        return "Screenplay"
-    elif "Score" in title or "Music" in title:
-        return "Original Score"
-    elif "Cinematography" in title:
-        return "Cinematography"
-    elif "Editing" in title:
-        return "Film Editing"
-    elif "Visual Effects" in title:
-        return "Visual Effects"
-    elif "Production Design" in title:
-        return "Production Design"
-    elif "Costume" in title:
-        return "Costume Design"
-    elif "Makeup" in title:
-        return "Makeup"
-    elif "Sound" in title:
-        return "Sound"
-    elif "Song" in title:
-        return "Original Song"
-    elif "How many" in title:
-        return "Total Wins"
-    else:
-        return "Other"
-
-
-def fetch_all_oscar_markets() -> Dict[str, Any]:
+    for needle, category, unless in CATEGORY_RULES:
+        if needle in title and (unless is None or unless not in title):
+            return category
+    return "Other"
+
+
+# Bumped whenever the shape of the cached market data changes, so entries
+# written by an older version are never read back (v2 adds by_category)
+ALL_MARKETS_CACHE_KEY = "all_markets_v2"
+
+
+async def fetch_all_oscar_markets() -> Dict[str, Any]:
     """Fetch all Oscar markets and organize by movie."""
-    cached = _get_cached("all_markets")
-    if cached:
-        return cached
+    return await _get_or_fetch(ALL_MARKETS_CACHE_KEY, _load_all_oscar_markets, serve_stale=True)
 
-    oscar_series = fetch_oscar_series()
-    all_markets = []
 
-    for series in oscar_series:
+async def _load_all_oscar_markets() -> Dict[str, Any]:
+    # Series are fetched concurrently, at most MAX_CONCURRENT_REQUESTS in flight
+    limit = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    async with _client_session() as client:
+        oscar_series = await fetch_oscar_series(client, limit)
+        series_markets = await asyncio.gather(*[
+            fetch_markets_for_series(client, limit, series["ticker"])
+            for series in oscar_series
+        ])
+
+    all_markets = []
+    for series, markets in zip(oscar_series, series_markets):
         ticker = series["ticker"]
-        markets = fetch_markets_for_series(ticker)
         for market in markets:
             market["_series_ticker"] = ticker
         all_markets.extend(markets)
-        time.sleep(0.3)  # Rate limiting
-
-    # Filter markets for each movie
-    movies_data = {}
-    for movie_name, movie_info in MOVIES.items():
-        matched_markets = []
-        for market in all_markets:
-            title = market.get("title", "")
-            subtitle = market.get("subtitle", "")
-            combined = f"{title} {subtitle}"
-
-            matched_keywords = match_keywords(combined, movie_info["keywords"])
-            if matched_keywords:
-                matched_markets.append({
-                    "ticker": market.get("ticker"),
-                    "title": title,
-                    "subtitle": subtitle,
-                    "category": extract_category(title),
-                    "yes_price": market.get("yes_ask"),
-                    "yes_bid": market.get("yes_bid"),
-                    "no_price": market.get("no_ask"),
-                    "volume": market.get("volume", 0) or 0,
-                    "volume_24h": market.get("volume_24h", 0) or 0,
-                    "open_interest": market.get("open_interest", 0) or 0,
-                    "matched_keywords": matched_keywords,
-                })
-
-        movies_data[movie_name] = {
-            "markets": matched_markets,
+
+    # Single pass over the markets, each one matched against every movie at once
+    movies_data = {
+        movie_name: {
+            "markets": [],
             "director": movie_info["director"],
             "year": movie_info["year"],
+            # category -> first matched market in that category
+            "by_category": {},
         }
+        for movie_name, movie_info in MOVIES.items()
+    }
+    for market in all_markets:
+        title = market.get("title", "")
+        subtitle = market.get("subtitle", "")
+        matches = match_movies(f"{title} {subtitle}")
+        if not matches:
+            continue
+
+        # Numeric fields are normalized here (missing/null -> 0) so readers can index directly
+        record = {
+            "ticker": market.get("ticker"),
+            "title": title,
+            "subtitle": subtitle,
+            "category": extract_category(title),
+            "yes_price": market.get("yes_ask") or 0,
+            "yes_bid": market.get("yes_bid"),
+            "no_price": market.get("no_ask"),
+            "volume": int(market.get("volume") or 0),
+            "volume_24h": int(market.get("volume_24h") or 0),
+            "open_interest": int(market.get("open_interest") or 0),
+        }
+        for movie_name, matched_keywords in matches.items():
+            movie_market = {**record, "matched_keywords": matched_keywords}
+            movies_data[movie_name]["markets"].append(movie_market)
+            movies_data[movie_name]["by_category"].setdefault(record["category"], movie_market)
 
     result = {
         "timestamp": datetime.now(timezone.utc).isoformat(),
@@ -316,7 +590,7 @@ def fetch_all_oscar_markets() -> Dict[str, Any]:
         "movies": movies_data,
     }
 
-    _set_cache("all_markets", result)
+    _set_cache(ALL_MARKETS_CACHE_KEY, result)
     return result
 
 
@@ -331,37 +605,49 @@ def calculate_metrics(markets: List[Dict]) -> Dict:
             "categories": [],
         }
 
-    yes_prices = [m.get("yes_price") for m in markets if m.get("yes_price")]
-    volumes = [m.get("volume", 0) or 0 for m in markets]
-    open_interests = [m.get("open_interest", 0) or 0 for m in markets]
-    categories = list(set(m.get("category", "Other") for m in markets))
+    # One pass over the markets for every aggregate
+    sum_yes = n_yes = total_volume = total_open_interest = 0
+    categories = set()
+    for m in markets:
+        yes_price = m["yes_price"]
+        if yes_price:
+            sum_yes += yes_price
+            n_yes += 1
+        total_volume += m["volume"]
+        total_open_interest += m["open_interest"]
+        categories.add(m["category"])
 
     return {
         "total_markets": len(markets),
-        "avg_yes_price": sum(yes_prices) / len(yes_prices) if yes_prices else 0,
-        "total_volume": sum(volumes),
-        "total_open_interest": sum(open_interests),
-        "categories": categories,
+        "avg_yes_price": sum_yes / n_yes if n_yes else 0,
+        "total_volume": total_volume,
+        "total_open_interest": total_open_interest,
+        "categories": list(categories),
     }
 
 
-def get_key_odds(markets: List[Dict], category: str) -> Optional[int]:
-    """Get odds for a specific category."""
-    for m in markets:
-        if m.get("category") == category:
-            return m.get("yes_price")
-    return None
+def get_key_odds(by_category: Dict[str, Dict], category: str) -> Optional[int]:
+    """Get odds for a specific category from a movie's by_category index."""
+    market = by_category.get(category)
+    return market["yes_price"] if market else None
+
+
+# Head-to-head display order; unlisted categories go last
+CATEGORY_ORDER = [
+    "Best Picture", "Best Director", "Best Actor", "Best Actress",
+    "Supporting Actor", "Supporting Actress", "Original Screenplay",
+    "Adapted Screenplay", "Cinematography", "Original Score", "Film Editing",
+]
+CATEGORY_RANK = {category: rank for rank, category in enumerate(CATEGORY_ORDER)}
 
 
 def build_head_to_head(movies_data: Dict) -> List[Dict]:
     """Build head-to-head comparison by category."""
     # Collect all categories across all movies
     all_categories = set()
-    for movie_name, data in movies_data.items():
-        for market in data["markets"]:
-            cat = market.get("category", "Other")
-            if cat not in ["Other", "Total Wins"]:
-                all_categories.add(cat)
+    for data in movies_data.values():
+        all_categories.update(data["by_category"])
+    all_categories -= {"Other", "Total Wins"}
 
     head_to_head = []
     for category in sorted(all_categories):
@@ -370,48 +656,39 @@ def build_head_to_head(movies_data: Dict) -> List[Dict]:
         leader = None
 
         for movie_name, data in movies_data.items():
-            for market in data["markets"]:
-                if market.get("category") == category:
-                    price = market.get("yes_price") or 0
-                    category_data["markets"][movie_name] = {
-                        "price": price,
-                        "volume": market.get("volume", 0),
-                        "ticker": market.get("ticker"),
-                    }
-                    if price > max_price:
-                        max_price = price
-                        leader = movie_name
-                    break
+            market = data["by_category"].get(category)
+            if market is None:
+                continue
+            price = market["yes_price"]
+            category_data["markets"][movie_name] = {
+                "price": price,
+                "volume": market["volume"],
+                "ticker": market["ticker"],
+            }
+            if price > max_price:
+                max_price = price
+                leader = movie_name
 
         if category_data["markets"]:
             category_data["leader"] = leader
             head_to_head.append(category_data)
 
     # Sort by importance
-    category_order = [
-        "Best Picture", "Best Director", "Best Actor", "Best Actress",
-        "Supporting Actor", "Supporting Actress", "Original Screenplay",
-        "Adapted Screenplay", "Cinematography", "Original Score", "Film Editing",
-    ]
-
-    def sort_key(item):
-        try:
-            return category_order.index(item["category"])
-        except ValueError:
-            return len(category_order)
-
-    return sorted(head_to_head, key=sort_key)
+    return sorted(head_to_head, key=lambda item: CATEGORY_RANK.get(item["category"], len(CATEGORY_ORDER)))
 
 
-def clear_cache():
+async def clear_cache():
     """Clear all cached data (memory and files)."""
-    global _cache, _cache_timestamps
-    _cache = {}
-    _cache_timestamps = {}
+    global _cache
+    _cache = OrderedDict()
 
-    # Clear file cache
-    for f in CACHE_DIR.glob("*.json"):
-        try:
-            f.unlink()
-        except OSError:
-            pass
+    # Clear file cache: swap in an empty directory with one rename (no await in
+    # between, so concurrent calls cannot interleave), then delete the old one in
+    # a worker thread instead of unlinking file by file on the event loop
+    old_dir = CACHE_DIR.with_name(f".cache.{uuid.uuid4().hex}")
+    try:
+        os.replace(CACHE_DIR, old_dir)
+    except OSError:
+        return
+    CACHE_DIR.mkdir(exist_ok=True)
+    asyncio.get_running_loop().run_in_executor(None, shutil.rmtree, old_dir, True)
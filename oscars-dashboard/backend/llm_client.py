@@ -1,5 +1,6 @@
 """OpenAI LLM client for structured meme generation."""
 
+import asyncio
 import os
 from typing import Type
 from pydantic import BaseModel
@@ -10,15 +11,20 @@ try:
 except ImportError:
     OPENAI_AVAILABLE = False
 
+# Completions in flight at once per client. This is the only limit on OpenAI
+# traffic; raise it in line with the account's rate limits.
+LLM_CONCURRENCY = int(os.getenv("LLM_CONCURRENCY", "5"))
+
 
 class OpenAIClient:
     """Real OpenAI client with structured outputs for meme generation."""
 
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, max_concurrency: int = LLM_CONCURRENCY):
         """Initialize the OpenAI client.
 
         Args:
             api_key: OpenAI API key. Falls back to OPENAI_API_KEY env var.
+            max_concurrency: Maximum completions in flight at once (OpenAI rate limits).
 
         Raises:
             ValueError: If no API key is found.
@@ -32,6 +38,7 @@ class OpenAIClient:
             raise ValueError("OPENAI_API_KEY not found in environment")
 
         self.client = AsyncOpenAI(api_key=self.api_key)
+        self._limit = asyncio.Semaphore(max_concurrency)
 
     async def _call_llm(
         self,
@@ -51,14 +58,15 @@ class OpenAIClient:
         Returns:
             Instance of response_format with generated content
         """
-        response = await self.client.beta.chat.completions.parse(
-            model=model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            response_format=response_format,
-        )
+        async with self._limit:
+            response = await self.client.beta.chat.completions.parse(
+                model=model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                response_format=response_format,
+            )
         return response.choices[0].message.parsed
 
 
@@ -1,17 +1,14 @@
 """FastAPI routes for meme generation and listing."""
 
+import asyncio
 import os
-import sys
 import time
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Optional, Literal
 
-from dotenv import load_dotenv
-from fastapi import APIRouter, HTTPException, Query
-
-# Load environment variables from .env file
-load_dotenv()
+from bootstrap import DEFAULT_RESPONSE_CLASS, MEMES_DIR  # Loads .env and puts oscars-memes on sys.path
+from fastapi import APIRouter, HTTPException, Query, Response
 
 from meme_models import (
     MemeTemplate,
@@ -24,17 +21,30 @@ from meme_models import (
     CommentListResponse,
 )
 
-# Add oscars-memes to path for imports
-MEMES_DIR = Path(__file__).parent.parent.parent / "oscars-memes"
-sys.path.insert(0, str(MEMES_DIR))
-
-from llm_pipeline import MEME_TEMPLATES, CommentDatabase, MemeGenerationPipeline
+from llm_pipeline import MEME_TEMPLATES, CommentDatabase, MemeGenerationPipeline, MarshaledOutput
 from llm_pipeline.generator import render_memes_by_category
+from llm_pipeline.templates import on_templates_refresh
 
 # Paths
 GENERATED_DIR = MEMES_DIR / "generated"
 
-router = APIRouter(prefix="/api/memes", tags=["memes"])
+# Characters of each comment shown in previews
+PREVIEW_CHARS = 200
+
+# /generate requests admitted at once (LLM calls plus rendering). This is
+# backpressure for the endpoint; OpenAI traffic itself is bounded only by
+# LLM_CONCURRENCY in llm_client.
+MEME_GEN_CONCURRENCY = int(os.getenv("MEME_GEN_CONCURRENCY", "8"))
+# Requests allowed to wait for a slot before /generate answers 503
+MEME_GEN_QUEUE_LIMIT = int(os.getenv("MEME_GEN_QUEUE_LIMIT", "32"))
+_GEN_SEM = asyncio.Semaphore(MEME_GEN_CONCURRENCY)
+_gen_waiting = 0
+
+router = APIRouter(
+    prefix="/api/memes",
+    tags=["memes"],
+    default_response_class=DEFAULT_RESPONSE_CLASS,
+)
 
 
 # Initialize comment database
@@ -43,54 +53,51 @@ comment_db = CommentDatabase(
 )
 
 
+# Mock meme text by field-name substring, checked in order
+_MOCK_RULES = (
+    ("reject", "Generic Oscar bait"),
+    ("approve", "One Battle After Another"),
+    ("strong", "OBAA quality"),
+    ("weak", "Sinners hype"),
+    ("medium", "Average drama"),
+    ("chad", "Cinema enjoyer"),
+    ("wojak", "'It's so deep bro'"),
+    ("top", "Can't be overrated"),
+    ("bottom", "With 16 nominations"),
+    ("happy", "New Oscar film!"),
+    ("concerned", "It's 3 hours"),
+    ("want", "Watch OBAA again"),
+    ("holding", "Responsibilities"),
+    ("button1", "Admit it's mid"),
+    ("button2", "Defend the hype"),
+    ("caption", "16 Oscar nominations??"),
+)
+_MOCK_FIELD_CACHE: dict[str, str] = {"reasoning": "Generated for Oscar campaign"}
+
+
+def _resolve_mock_value(field: str) -> str:
+    """Mock text for a field name, cached after the first lookup."""
+    value = _MOCK_FIELD_CACHE.get(field)
+    if value is None:
+        value = next((v for needle, v in _MOCK_RULES if needle in field), "Meme text")
+        _MOCK_FIELD_CACHE[field] = value
+    return value
+
+
 # Mock LLM client for fallback when OpenAI is not available
 class MockLLMClient:
     """Mock LLM client - used when OpenAI API key is not available."""
 
     async def _call_llm(self, model, system_prompt, user_prompt, response_format):
         """Generate mock meme content."""
-        fields = response_format.model_fields.keys()
-        mock_values = {}
-
-        for field in fields:
-            if field == "reasoning":
-                mock_values[field] = "Generated for Oscar campaign"
-            elif "reject" in field:
-                mock_values[field] = "Generic Oscar bait"
-            elif "approve" in field:
-                mock_values[field] = "One Battle After Another"
-            elif "strong" in field:
-                mock_values[field] = "OBAA quality"
-            elif "weak" in field:
-                mock_values[field] = "Sinners hype"
-            elif "medium" in field:
-                mock_values[field] = "Average drama"
-            elif "chad" in field:
-                mock_values[field] = "Cinema enjoyer"
-            elif "wojak" in field:
-                mock_values[field] = "'It's so deep bro'"
-            elif "top" in field:
-                mock_values[field] = "Can't be overrated"
-            elif "bottom" in field:
-                mock_values[field] = "With 16 nominations"
-            elif "happy" in field:
-                mock_values[field] = "New Oscar film!"
-            elif "concerned" in field:
-                mock_values[field] = "It's 3 hours"
-            elif "want" in field:
-                mock_values[field] = "Watch OBAA again"
-            elif "holding" in field:
-                mock_values[field] = "Responsibilities"
-            elif "button1" in field:
-                mock_values[field] = "Admit it's mid"
-            elif "button2" in field:
-                mock_values[field] = "Defend the hype"
-            elif "caption" in field:
-                mock_values[field] = "16 Oscar nominations??"
-            else:
-                mock_values[field] = "Meme text"
+        # Marshaled requests ask for several variations of one template
+        if issubclass(response_format, MarshaledOutput):
+            mock = await self._call_llm(model, system_prompt, user_prompt, response_format.item_model)
+            return response_format(memes=[mock] * response_format.batch_size)
 
-        return response_format(**mock_values)
+        # Synthetic values always fit the model, so skip validation
+        mock_values = {field: _resolve_mock_value(field) for field in response_format.model_fields}
+        return response_format.model_construct(**mock_values)
 
 
 # Initialize LLM client - use OpenAI if available, otherwise fall back to mock
@@ -105,6 +112,12 @@ except (ImportError, ValueError) as e:
 pipeline = MemeGenerationPipeline(llm_client, comment_db)
 
 
+# Parsed memes per category, keyed on the category directory's mtime in ns.
+# Writes landing within one mtime tick of a scan are covered by generate_memes
+# dropping the entry after it renders.
+_meme_cache: dict[str, tuple[int, list[GeneratedMemeResponse]]] = {}
+
+
 def scan_memes_directory(category: Optional[str] = None) -> list:
     """Scan the generated directory for memes."""
     memes = []
@@ -113,29 +126,44 @@ def scan_memes_directory(category: Optional[str] = None) -> list:
 
     for cat in categories:
         cat_dir = GENERATED_DIR / cat
-        if not cat_dir.exists():
+        try:
+            cat_dir_mtime = os.stat(cat_dir).st_mtime_ns
+        except FileNotFoundError:
+            continue
+
+        cached = _meme_cache.get(cat)
+        if cached and cached[0] == cat_dir_mtime:
+            memes.extend(cached[1])
             continue
 
-        for file in sorted(cat_dir.glob("*.png")):
+        with os.scandir(cat_dir) as it:
+            entries = [e for e in it if e.name.endswith(".png") and e.is_file()]
+        entries.sort(key=lambda e: e.name)
+
+        cat_memes = []
+        for entry in entries:
             # Parse filename to extract metadata
-            parts = file.stem.split("_")
+            stem = entry.name[:-len(".png")]
+            parts = stem.split("_", 2)
             template_id = parts[1] if len(parts) > 1 else "unknown"
 
-            meme = GeneratedMemeResponse(
-                id=file.stem,
-                filename=file.name,
-                url=f"/memes/{cat}/{file.name}",
+            cat_memes.append(GeneratedMemeResponse(
+                id=stem,
+                filename=entry.name,
+                url=f"/memes/{cat}/{entry.name}",
                 template_id=template_id,
                 category=cat,
                 text_content={},  # Text not stored in filename
-                created_at=datetime.fromtimestamp(file.stat().st_mtime, tz=timezone.utc),
-            )
-            memes.append(meme)
+                created_at=datetime.fromtimestamp(entry.stat().st_mtime, tz=timezone.utc),
+            ))
+
+        _meme_cache[cat] = (cat_dir_mtime, cat_memes)
+        memes.extend(cat_memes)
 
     return memes
 
 
-@router.get("", response_model=MemeListResponse)
+@router.get("", responses={200: {"model": MemeListResponse}})
 async def list_memes(
     category: Optional[Literal["pro_obaa", "anti_sinners"]] = Query(None),
 ):
@@ -149,18 +177,25 @@ async def list_memes(
             cat = meme.category
             categories[cat] = categories.get(cat, 0) + 1
 
-        return MemeListResponse(
+        # Memes are already validated models, so skip revalidating them
+        response = MemeListResponse.model_construct(
             memes=memes,
             total=len(memes),
             categories=categories,
         )
+        return Response(content=response.model_dump_json().encode(), media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/templates", response_model=TemplateListResponse)
-async def list_templates():
-    """List all available meme templates."""
+# Template listing is static between template finalizations, so serialize it once
+_templates_body: bytes = b""
+
+
+@on_templates_refresh
+def _rebuild_templates_cache() -> None:
+    """Rebuild the pre-serialized template listing from MEME_TEMPLATES."""
+    global _templates_body
     templates = [
         MemeTemplate(
             id=tid,
@@ -174,15 +209,33 @@ async def list_templates():
         for tid, t in MEME_TEMPLATES.items()
     ]
 
-    return TemplateListResponse(
+    response = TemplateListResponse(
         templates=templates,
         total=len(templates),
     )
+    _templates_body = response.model_dump_json().encode()
+
+
+_rebuild_templates_cache()
+
+
+@router.get("/templates", responses={200: {"model": TemplateListResponse}})
+async def list_templates():
+    """List all available meme templates."""
+    return Response(content=_templates_body, media_type="application/json")
 
 
 @router.post("/generate", response_model=GenerateMemeResponse)
 async def generate_memes(request: GenerateMemeRequest):
     """Generate new memes using the LLM pipeline."""
+    global _gen_waiting
+    if _GEN_SEM.locked() and _gen_waiting >= MEME_GEN_QUEUE_LIMIT:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many meme generations in progress, try again shortly",
+            headers={"Retry-After": "5"},
+        )
+
     try:
         start_time = time.time()
 
@@ -197,11 +250,22 @@ async def generate_memes(request: GenerateMemeRequest):
             tone_preference=request.tone,
         )
 
-        # Generate memes
-        batch = await pipeline.generate_batch(pipeline_request)
-
-        # Render to images - saves directly to category folders
-        render_result = render_memes_by_category(batch)
+        # Bound total LLM traffic so concurrent requests don't trip rate limits
+        _gen_waiting += 1
+        try:
+            await _GEN_SEM.acquire()
+        finally:
+            _gen_waiting -= 1
+        try:
+            # Generate memes
+            batch = await pipeline.generate_batch(pipeline_request)
+
+            # Render to images - saves directly to category folders.
+            # Pillow work runs off the event loop so other requests keep moving.
+            render_result = await asyncio.to_thread(render_memes_by_category, batch)
+        finally:
+            _GEN_SEM.release()
+        _meme_cache.pop(request.category, None)
         paths = render_result.get(request.category, [])
 
         # Build response
@@ -220,16 +284,17 @@ async def generate_memes(request: GenerateMemeRequest):
         generation_time = int((time.time() - start_time) * 1000)
 
         return GenerateMemeResponse(
-            success=True,
+            success=bool(memes) or not batch.errors,
             memes=memes,
             generation_time_ms=generation_time,
+            errors=batch.errors,
         )
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/comments/{movie}", response_model=CommentListResponse)
+@router.get("/comments/{movie}", responses={200: {"model": CommentListResponse}})
 async def get_comments(
     movie: str,
     sentiment: Literal["positive", "negative", "all"] = "all",
@@ -237,47 +302,50 @@ async def get_comments(
 ):
     """Get sentiment comments for a movie."""
     try:
+        # One cached load covers the lists, the text index and the stats
+        snapshot = await asyncio.to_thread(comment_db.load_movie, movie)
+
         if sentiment == "positive":
-            comments_raw = comment_db.get_positive_comments(movie, limit=limit)
-            compound_filter = lambda c: c.compound > 0.2
+            comments_raw = snapshot.positive(limit=limit)
         elif sentiment == "negative":
-            comments_raw = comment_db.get_negative_comments(movie, limit=limit)
-            compound_filter = lambda c: c.compound < -0.2
+            comments_raw = snapshot.negative(limit=limit)
         else:
             # Get both
-            pos = comment_db.get_positive_comments(movie, limit=limit // 2)
-            neg = comment_db.get_negative_comments(movie, limit=limit // 2)
-            comments_raw = pos + neg
+            comments_raw = snapshot.positive(limit=limit // 2) + snapshot.negative(limit=limit // 2)
 
-        # Get full comment objects for stats
-        all_comments = comment_db.get_all_comments(movie)
+        # Full comment objects by text, for sentiment and score
+        by_text = snapshot.by_text
 
-        # Build response
+        # Build response from trusted CSV data, skipping validation
         comments = []
         for text in comments_raw[:limit]:
+            # Truncate for preview
+            preview = text if len(text) <= PREVIEW_CHARS else text[:PREVIEW_CHARS]
+
             # Find the matching comment object
-            matching = next((c for c in all_comments if c.full_text == text), None)
+            matching = by_text.get(text)
             if matching:
-                comments.append(CommentPreview(
-                    text=text[:200],  # Truncate for preview
+                comments.append(CommentPreview.model_construct(
+                    text=preview,
                     sentiment=matching.sentiment,
                     compound_score=matching.compound,
                 ))
             else:
-                comments.append(CommentPreview(
-                    text=text[:200],
+                comments.append(CommentPreview.model_construct(
+                    text=preview,
                     sentiment="Unknown",
                     compound_score=0.0,
                 ))
 
-        stats = comment_db.get_comment_stats(movie)
+        stats = snapshot.stats
 
-        return CommentListResponse(
+        response = CommentListResponse.model_construct(
             movie=movie,
             comments=comments,
             total=stats.get("total", 0),
             avg_compound=stats.get("avg_compound", 0.0),
         )
+        return Response(content=response.model_dump_json().encode(), media_type="application/json")
 
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"No data found for movie: {movie}")
@@ -2,37 +2,61 @@
 
 import asyncio
 import os
-import sys
+import time
 import uuid
 import shutil
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any
+from typing import Optional
 
-from fastapi import APIRouter, HTTPException, UploadFile, File, BackgroundTasks
+from bootstrap import DEFAULT_RESPONSE_CLASS  # Loads .env and puts oscars-memes on sys.path
+from fastapi import APIRouter, HTTPException, UploadFile, File, BackgroundTasks, Response
 from fastapi.responses import StreamingResponse
+from PIL import Image
 from pydantic import BaseModel, Field
 
-# Add oscars-memes to path for imports
-MEMES_DIR = Path(__file__).parent.parent.parent / "oscars-memes"
-sys.path.insert(0, str(MEMES_DIR))
+# Optional: hand template processing to a separate arq worker
+try:
+    from arq import create_pool
+    from arq.connections import RedisSettings
+except ImportError:
+    create_pool = None
 
 from llm_pipeline import MEME_TEMPLATES
-from llm_pipeline.template_agents import (
-    TemplateOrchestrator,
-    TemplateProcessingResult,
-)
+from llm_pipeline.templates import on_templates_refresh, refresh_templates
+from llm_pipeline.template_agents import TemplateProcessingResult
 from llm_pipeline.template_integrator import TemplateIntegrator
 
+from job_store import JOB_TTL_SECONDS, RedisJobStore, job_store
+from worker import process_template_job
+
 # Paths
 TEMPLATE_IMAGE_DIR = Path(__file__).parent.parent.parent / "MemeTemplate"
 UPLOAD_DIR = Path(__file__).parent / "uploads"
 UPLOAD_DIR.mkdir(exist_ok=True)
+WORKING_DIR = UPLOAD_DIR / "working"  # Downscaled copies the agents analyse
+WORKING_DIR.mkdir(exist_ok=True)
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MB per copy when saving uploads
+TEMPLATE_MAX_EDGE = 1024  # Longest side of an uploaded template after preprocessing
+UPLOAD_SWEEP_INTERVAL = int(os.getenv("UPLOAD_SWEEP_INTERVAL", "3600"))  # Seconds between upload sweeps
+
+router = APIRouter(
+    prefix="/api/templates",
+    tags=["templates"],
+    default_response_class=DEFAULT_RESPONSE_CLASS,
+)
 
-router = APIRouter(prefix="/api/templates", tags=["templates"])
+# Jobs go to the arq worker only when it can see the same (Redis) job store
+USE_WORKER_QUEUE = create_pool is not None and isinstance(job_store, RedisJobStore)
+_arq_pool = None
 
-# In-memory storage for processing jobs (in production, use Redis or database)
-processing_jobs: Dict[str, Dict[str, Any]] = {}
+
+async def _get_arq_pool():
+    """Connect to the arq queue on first use."""
+    global _arq_pool
+    if _arq_pool is None:
+        _arq_pool = await create_pool(RedisSettings.from_dsn(os.environ["REDIS_URL"]))
+    return _arq_pool
 
 
 # === Request/Response Models ===
@@ -83,29 +107,93 @@ class FinalizeResponse(BaseModel):
     message: str
 
 
+def _downscale_image(path: Path, working_path: Path) -> tuple[Path, float]:
+    """Write a copy of path whose longest side is at most TEMPLATE_MAX_EDGE.
+
+    The agents send the image to the vision model at every stage, so they work
+    on the small copy while the original is kept for finalize. Returns the path
+    to analyse and the factor mapping its pixels back to the original's.
+    """
+    with Image.open(path) as img:
+        longest = max(img.size)
+        if longest <= TEMPLATE_MAX_EDGE:
+            return path, 1.0
+        img_format = img.format
+        img.thumbnail((TEMPLATE_MAX_EDGE, TEMPLATE_MAX_EDGE), Image.LANCZOS)
+        img.save(working_path, format=img_format, optimize=True, quality=90)
+        return working_path, longest / max(img.size)
+
+
+def sweep_uploads(directory: Path = UPLOAD_DIR, max_age: int = JOB_TTL_SECONDS) -> int:
+    """Delete uploads older than max_age seconds and return how many went.
+
+    A job outlives its upload by at most the job TTL, so anything older
+    belongs to a template that was never finalized (or to a crashed worker).
+    """
+    cutoff = time.time() - max_age
+    removed = 0
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            try:
+                if entry.is_file(follow_symlinks=False) and entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+                    removed += 1
+            except FileNotFoundError:
+                continue  # Finalized or swept concurrently
+    return removed
+
+
+def _sweep_all_uploads() -> int:
+    """Sweep both the original uploads and their working copies."""
+    return sweep_uploads(UPLOAD_DIR) + sweep_uploads(WORKING_DIR)
+
+
+async def upload_janitor() -> None:
+    """Periodically drop expired jobs and their abandoned uploads."""
+    while True:
+        await asyncio.sleep(UPLOAD_SWEEP_INTERVAL)
+        try:
+            await job_store.prune()
+            removed = await asyncio.to_thread(_sweep_all_uploads)
+            if removed:
+                print(f"Removed {removed} stale template uploads")
+        except Exception as e:
+            print(f"Upload sweep failed: {e}")
+
+
 # === Endpoints ===
 
-@router.get("", response_model=TemplateListResponse)
-async def list_templates():
-    """List all available meme templates."""
-    templates = []
-    for template_id, template_data in MEME_TEMPLATES.items():
-        templates.append(TemplateInfo(
-            id=template_data["id"],
-            name=template_data["name"],
-            filename=template_data["filename"],
-            text_slots=template_data["text_slots"],
-            slot_names=template_data["slot_names"],
-            irony_type=template_data["irony_type"],
-            description=template_data["description"],
-            max_chars_per_slot=template_data["max_chars_per_slot"],
+# Template listing is static between template finalizations, so serialize it once
+_templates_body: bytes = b""
+
+
+@on_templates_refresh
+def _rebuild_templates_cache() -> None:
+    """Rebuild the pre-serialized template listing from MEME_TEMPLATES."""
+    global _templates_body
+    # Registry entries are trusted and already carry every TemplateInfo field
+    templates = [
+        TemplateInfo.model_construct(
+            **template_data,
             thumbnail_url=f"/templates/{template_data['filename']}",
-        ))
+        )
+        for template_data in MEME_TEMPLATES.values()
+    ]
 
-    return TemplateListResponse(
+    response = TemplateListResponse(
         templates=templates,
         total=len(templates),
     )
+    _templates_body = response.model_dump_json().encode()
+
+
+_rebuild_templates_cache()
+
+
+@router.get("", responses={200: {"model": TemplateListResponse}})
+async def list_templates():
+    """List all available meme templates."""
+    return Response(content=_templates_body, media_type="application/json")
 
 
 @router.post("/upload")
@@ -130,12 +218,20 @@ async def upload_template(
     # Save uploaded file
     upload_path = UPLOAD_DIR / f"{job_id}_{file.filename}"
     with open(upload_path, "wb") as f:
-        content = await file.read()
-        f.write(content)
+        # Copy in fixed-size chunks off the event loop instead of reading it all
+        await asyncio.to_thread(shutil.copyfileobj, file.file, f, UPLOAD_CHUNK_SIZE)
+
+    working_path = WORKING_DIR / upload_path.name
+    try:
+        analysis_path, scale = await asyncio.to_thread(_downscale_image, upload_path, working_path)
+    except (OSError, Image.DecompressionBombError):
+        upload_path.unlink(missing_ok=True)
+        working_path.unlink(missing_ok=True)
+        raise HTTPException(status_code=400, detail="Uploaded file is not a readable image")
 
     # Initialize job status
     now = datetime.now(timezone.utc)
-    processing_jobs[job_id] = {
+    await job_store.create(job_id, {
         "job_id": job_id,
         "status": "pending",
         "current_stage": None,
@@ -146,11 +242,16 @@ async def upload_template(
         "created_at": now,
         "updated_at": now,
         "image_path": str(upload_path),
+        "analysis_path": str(analysis_path),
         "original_filename": file.filename,
-    }
+    })
 
-    # Start processing in background
-    background_tasks.add_task(process_template_job, job_id, str(upload_path))
+    # Start processing in the worker, or in this process if there is no queue
+    if USE_WORKER_QUEUE:
+        pool = await _get_arq_pool()
+        await pool.enqueue_job("process_template_task", job_id, str(analysis_path), scale)
+    else:
+        background_tasks.add_task(process_template_job, job_id, str(analysis_path), scale)
 
     return {
         "job_id": job_id,
@@ -159,54 +260,10 @@ async def upload_template(
     }
 
 
-async def process_template_job(job_id: str, image_path: str):
-    """Background task to process a template through all agents."""
-    job = processing_jobs.get(job_id)
-    if not job:
-        return
-
-    job["status"] = "running"
-    job["updated_at"] = datetime.now(timezone.utc)
-
-    try:
-        # Check if OpenAI API key is available
-        if not os.getenv("OPENAI_API_KEY"):
-            job["status"] = "failed"
-            job["error"] = "OpenAI API key not configured. Set OPENAI_API_KEY environment variable."
-            job["updated_at"] = datetime.now(timezone.utc)
-            return
-
-        # Create orchestrator with progress callback
-        def on_stage_complete(stage: str, result: Any):
-            job["stages_completed"].append(stage)
-            job["current_stage"] = stage
-            stage_index = len(job["stages_completed"])
-            job["progress_percent"] = int((stage_index / 7) * 100)
-            job["updated_at"] = datetime.now(timezone.utc)
-
-        orchestrator = TemplateOrchestrator(
-            on_stage_complete=on_stage_complete,
-        )
-
-        # Run the processing pipeline
-        result = await orchestrator.process(image_path)
-
-        # Store result
-        job["status"] = "completed"
-        job["progress_percent"] = 100
-        job["result"] = result.model_dump()
-        job["updated_at"] = datetime.now(timezone.utc)
-
-    except Exception as e:
-        job["status"] = "failed"
-        job["error"] = str(e)
-        job["updated_at"] = datetime.now(timezone.utc)
-
-
 @router.get("/process/{job_id}", response_model=ProcessingStatus)
 async def get_processing_status(job_id: str):
     """Get the status of a template processing job."""
-    job = processing_jobs.get(job_id)
+    job = await job_store.get(job_id)
     if not job:
         raise HTTPException(
             status_code=404,
@@ -229,7 +286,7 @@ async def get_processing_status(job_id: str):
 @router.post("/finalize", response_model=FinalizeResponse)
 async def finalize_template(request: FinalizeRequest):
     """Finalize and integrate a processed template into the pipeline."""
-    job = processing_jobs.get(request.job_id)
+    job = await job_store.get(request.job_id)
     if not job:
         raise HTTPException(
             status_code=404,
@@ -283,10 +340,11 @@ async def finalize_template(request: FinalizeRequest):
         if integration_success:
             registry_entry = result.build_registry_entry()
             MEME_TEMPLATES[result.metadata.id] = registry_entry
+            refresh_templates()
 
-        # Clean up upload
-        if source_path.exists():
-            source_path.unlink()
+        # Clean up the upload and its working copy
+        source_path.unlink(missing_ok=True)
+        Path(job.get("analysis_path", source_path)).unlink(missing_ok=True)
 
         return FinalizeResponse(
             success=integration_success,
@@ -0,0 +1,115 @@
+"""Background worker for template processing.
+
+When REDIS_URL is set and arq is installed, the API enqueues uploaded
+templates and this worker runs them, so the multi-stage orchestrator never
+blocks a web worker. Run it next to the API (sharing the uploads directory):
+
+    arq worker.WorkerSettings
+
+Without a queue the API falls back to running process_template_job in-process.
+"""
+
+import asyncio
+import os
+from datetime import datetime, timezone
+from typing import Optional, Any
+
+import bootstrap  # Loads .env and puts oscars-memes on sys.path
+
+# Optional: Redis-backed job queue
+try:
+    from arq.connections import RedisSettings
+except ImportError:
+    RedisSettings = None
+
+from llm_pipeline.template_agents import TemplateOrchestrator
+
+from job_store import job_store
+
+
+async def process_template_job(job_id: str, image_path: str, scale: float = 1.0):
+    """Background task to process a template through all agents.
+
+    image_path may be a downscaled working copy; scale maps its slot
+    positions back to the original upload that finalize installs.
+    """
+    job = await job_store.get(job_id)
+    if not job:
+        return
+
+    await job_store.update(job_id, status="running", updated_at=datetime.now(timezone.utc))
+
+    # Stage updates come from a sync callback, so they are written in order
+    # by chaining each write onto the previous one
+    last_write: Optional[asyncio.Task] = None
+
+    async def write_after(previous: Optional[asyncio.Task], **fields: Any):
+        if previous is not None:
+            await previous
+        await job_store.update(job_id, **fields)
+
+    try:
+        # Check if OpenAI API key is available
+        if not os.getenv("OPENAI_API_KEY"):
+            await job_store.update(
+                job_id,
+                status="failed",
+                error="OpenAI API key not configured. Set OPENAI_API_KEY environment variable.",
+                updated_at=datetime.now(timezone.utc),
+            )
+            return
+
+        # Create orchestrator with progress callback
+        stages_completed = job["stages_completed"]
+
+        def on_stage_complete(stage: str, result: Any):
+            nonlocal last_write
+            stages_completed.append(stage)
+            stage_index = len(stages_completed)
+            last_write = asyncio.create_task(write_after(
+                last_write,
+                stages_completed=list(stages_completed),
+                current_stage=stage,
+                progress_percent=int((stage_index / 7) * 100),
+                updated_at=datetime.now(timezone.utc),
+            ))
+
+        orchestrator = TemplateOrchestrator(
+            on_stage_complete=on_stage_complete,
+        )
+
+        # Run the processing pipeline
+        result = await orchestrator.process(image_path, scale=scale)
+
+        # Store result
+        if last_write is not None:
+            await last_write
+        await job_store.update(
+            job_id,
+            status="completed",
+            progress_percent=100,
+            result=result.model_dump(mode="json"),
+            updated_at=datetime.now(timezone.utc),
+        )
+
+    except Exception as e:
+        if last_write is not None:
+            await asyncio.gather(last_write, return_exceptions=True)
+        await job_store.update(
+            job_id,
+            status="failed",
+            error=str(e),
+            updated_at=datetime.now(timezone.utc),
+        )
+
+
+async def process_template_task(ctx: dict, job_id: str, image_path: str, scale: float = 1.0):
+    """arq entry point for process_template_job."""
+    await process_template_job(job_id, image_path, scale)
+
+
+class WorkerSettings:
+    """Settings for `arq worker.WorkerSettings`."""
+    functions = [process_template_task]
+    redis_settings = RedisSettings.from_dsn(os.getenv("REDIS_URL", "redis://localhost:6379")) if RedisSettings else None
+    max_jobs = int(os.getenv("TEMPLATE_WORKER_CONCURRENCY", "4"))
@@ -33,6 +33,7 @@ from .models import (
     WantHoldingOutput,
     TwoButtonsOutput,
     MJCryingOutput,
+    MarshaledOutput,
     GeneratedMeme,
     BatchMemeOutput,
     MemeGenerationRequest,
@@ -56,6 +57,7 @@ __all__ = [
     "WantHoldingOutput",
     "TwoButtonsOutput",
     "MJCryingOutput",
+    "MarshaledOutput",
     "GeneratedMeme",
     "BatchMemeOutput",
     "MemeGenerationRequest",
@@ -2,8 +2,10 @@
 
 import csv
 import os
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Literal
+from typing import Dict, List, Optional, Literal
 from dataclasses import dataclass
 
 
@@ -29,6 +31,82 @@ MOVIE_FILE_MAPPING = {
 }
 
 
+@dataclass
+class CommentIndex:
+    """All comments of one CSV plus the orderings and stats built from them."""
+    comments: List[Comment]
+    by_compound_asc: List[Comment]  # Most negative first
+    by_compound_desc: List[Comment]  # Most positive first
+    asc_keys: List[float]  # compound of each by_compound_asc entry
+    desc_keys: List[float]  # -compound of each by_compound_desc entry
+    by_text: Dict[str, Comment]  # full_text -> first comment with that text
+    stats: dict
+
+    def negative(self, limit: int = 20, min_compound: float = -1.0, max_compound: float = -0.2) -> List[str]:
+        """Texts with compound in range, most negative first (lowest compound)."""
+        start = bisect_left(self.asc_keys, min_compound)
+        end = min(bisect_right(self.asc_keys, max_compound), start + limit)
+        return [c.full_text for c in self.by_compound_asc[start:end]]
+
+    def positive(self, limit: int = 20, min_compound: float = 0.3, max_compound: float = 1.0) -> List[str]:
+        """Texts with compound in range, most positive first (highest compound)."""
+        start = bisect_left(self.desc_keys, -max_compound)
+        end = min(bisect_right(self.desc_keys, -min_compound), start + limit)
+        return [c.full_text for c in self.by_compound_desc[start:end]]
+
+
+@lru_cache(maxsize=256)
+def _load_index(csv_path: str, mtime: float) -> CommentIndex:
+    """Parse a sentiment CSV once per (path, mtime)."""
+    comments = []
+
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            try:
+                comment = Comment(
+                    text=row.get('comment', ''),
+                    full_text=row.get('full_comment', row.get('comment', '')),
+                    negative=float(row.get('negative', 0)),
+                    neutral=float(row.get('neutral', 0)),
+                    positive=float(row.get('positive', 0)),
+                    compound=float(row.get('compound', 0)),
+                    sentiment=row.get('sentiment', 'Neutral'),
+                )
+                comments.append(comment)
+            except (ValueError, KeyError) as e:
+                continue  # Skip malformed rows
+
+    if comments:
+        compounds = [c.compound for c in comments]
+        stats = {
+            "total": len(comments),
+            "avg_compound": sum(compounds) / len(compounds),
+            "positive_count": sum(1 for c in comments if c.sentiment == "Positive"),
+            "negative_count": sum(1 for c in comments if c.sentiment == "Negative"),
+            "neutral_count": sum(1 for c in comments if c.sentiment == "Neutral"),
+            "most_positive": max(compounds),
+            "most_negative": min(compounds),
+        }
+    else:
+        stats = {"total": 0}
+
+    # Stable sorts, so ties keep file order as the per-call sorts did
+    by_compound_asc = sorted(comments, key=lambda c: c.compound)
+    by_compound_desc = sorted(comments, key=lambda c: c.compound, reverse=True)
+
+    return CommentIndex(
+        comments=comments,
+        by_compound_asc=by_compound_asc,
+        by_compound_desc=by_compound_desc,
+        asc_keys=[c.compound for c in by_compound_asc],
+        desc_keys=[-c.compound for c in by_compound_desc],
+        # Reversed so the first occurrence of a text wins
+        by_text={c.full_text: c for c in reversed(comments)},
+        stats=stats,
+    )
+
+
 class CommentDatabase:
     """Handles fetching comments from sentiment CSV files."""
 
@@ -67,29 +145,18 @@ class CommentDatabase:
 
         return csv_path
 
-    def _load_comments(self, movie: str) -> List[Comment]:
-        """Load all comments for a movie from CSV."""
+    def load_movie(self, movie: str) -> CommentIndex:
+        """Load everything known about a movie's comments in one call.
+
+        The CSV is reparsed only when its mtime changes. The returned index
+        is shared between callers; treat it as read-only.
+        """
         csv_path = self._get_csv_path(movie)
-        comments = []
-
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                try:
-                    comment = Comment(
-                        text=row.get('comment', ''),
-                        full_text=row.get('full_comment', row.get('comment', '')),
-                        negative=float(row.get('negative', 0)),
-                        neutral=float(row.get('neutral', 0)),
-                        positive=float(row.get('positive', 0)),
-                        compound=float(row.get('compound', 0)),
-                        sentiment=row.get('sentiment', 'Neutral'),
-                    )
-                    comments.append(comment)
-                except (ValueError, KeyError) as e:
-                    continue  # Skip malformed rows
+        return _load_index(str(csv_path), os.stat(csv_path).st_mtime)
 
-        return comments
+    def _load_comments(self, movie: str) -> List[Comment]:
+        """Load all comments for a movie from CSV."""
+        return list(self.load_movie(movie).comments)
 
     def get_negative_comments(
         self,
@@ -109,19 +176,7 @@ class CommentDatabase:
         Returns:
             List of comment texts
         """
-        comments = self._load_comments(movie)
-
-        # Filter by compound score range
-        negative = [
-            c for c in comments
-            if min_compound <= c.compound <= max_compound
-        ]
-
-        # Sort by most negative first (lowest compound)
-        negative.sort(key=lambda c: c.compound)
-
-        # Return text only
-        return [c.full_text for c in negative[:limit]]
+        return self.load_movie(movie).negative(limit, min_compound, max_compound)
 
     def get_positive_comments(
         self,
@@ -141,19 +196,7 @@ class CommentDatabase:
         Returns:
             List of comment texts
         """
-        comments = self._load_comments(movie)
-
-        # Filter by compound score range
-        positive = [
-            c for c in comments
-            if min_compound <= c.compound <= max_compound
-        ]
-
-        # Sort by most positive first (highest compound)
-        positive.sort(key=lambda c: c.compound, reverse=True)
-
-        # Return text only
-        return [c.full_text for c in positive[:limit]]
+        return self.load_movie(movie).positive(limit, min_compound, max_compound)
 
     def get_controversial_comments(
         self,
@@ -202,22 +245,7 @@ class CommentDatabase:
 
     def get_comment_stats(self, movie: str) -> dict:
         """Get sentiment statistics for a movie."""
-        comments = self._load_comments(movie)
-
-        if not comments:
-            return {"total": 0}
-
-        compounds = [c.compound for c in comments]
-
-        return {
-            "total": len(comments),
-            "avg_compound": sum(compounds) / len(compounds),
-            "positive_count": sum(1 for c in comments if c.sentiment == "Positive"),
-            "negative_count": sum(1 for c in comments if c.sentiment == "Negative"),
-            "neutral_count": sum(1 for c in comments if c.sentiment == "Neutral"),
-            "most_positive": max(compounds),
-            "most_negative": min(compounds),
-        }
+        return dict(self.load_movie(movie).stats)
 
     def get_all_comments(
         self,
@@ -1,14 +1,20 @@
 """Integration with meme_generator.py for rendering LLM-generated meme text."""
 
-import sys
+import atexit
+import multiprocessing
+import os
+import threading
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import asyncio
 from datetime import datetime
 
-# Add parent directory to path for importing meme_generator
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
+# meme_generator sits next to this package, so it resolves from the same
+# sys.path entry that found llm_pipeline
 from meme_generator import (
     create_drake_meme,
     create_doge_meme,
@@ -81,16 +87,73 @@ TEMPLATE_GENERATORS = {
         "args_map": ["caption"],  # Single arg maps to text parameter
     },
     "incognito_face_change": {
-    "function": create_incognito_face_change_meme,
-    "slots": ['character_text', 'shadow_text'],
+        "function": create_incognito_face_change_meme,
+        "slots": ['character_text', 'shadow_text'],
+    },
     "mr_incredible_uncanny": {
-    "function": create_mr_incredible_uncanny_meme,
-    "slots": ['normal_text', 'distorted_text'],
+        "function": create_mr_incredible_uncanny_meme,
+        "slots": ['normal_text', 'distorted_text'],
+    },
 }
-},
+
+# Integrated templates may list their arguments under "slots"; normalize every
+# entry to an args_map tuple once so rendering never has to branch on it
+for _config in TEMPLATE_GENERATORS.values():
+    _config["args_map"] = tuple(_config.get("args_map") or _config.get("slots") or ())
+
+
+def _slot_extractor(args_map: Tuple[str, ...]):
+    """Build a callable returning a template's slot values as a tuple, in order."""
+    if not args_map:
+        return lambda content: ()
+    getter = itemgetter(*args_map)
+    if len(args_map) == 1:
+        return lambda content: (getter(content),)
+    return getter
+
+
+# Per-template slot extractors, built once instead of walking args_map per render
+TEMPLATE_EXTRACTORS = {
+    template_id: _slot_extractor(config["args_map"])
+    for template_id, config in TEMPLATE_GENERATORS.items()
 }
 
 
+# Processes used to render a batch; rendering is CPU-bound Pillow work
+RENDER_WORKERS = int(os.getenv("RENDER_WORKERS", str(os.cpu_count() or 1)))
+
+# Smaller batches render inline; handing them to the pool costs more than it saves
+RENDER_POOL_MIN_BATCH = 4
+
+# Shared render pool, started on first use and reused across batches.
+# Workers are spawned rather than forked: batches are rendered from worker
+# threads of a process that also runs the event loop.
+_render_pool: Optional[ProcessPoolExecutor] = None
+_render_pool_lock = threading.Lock()
+
+
+def _get_render_pool() -> ProcessPoolExecutor:
+    """Return the shared render pool, starting it on first use."""
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is None:
+            _render_pool = ProcessPoolExecutor(
+                max_workers=RENDER_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _render_pool
+
+
+@atexit.register
+def _shutdown_render_pool() -> None:
+    """Stop the shared render pool's workers."""
+    global _render_pool
+    with _render_pool_lock:
+        pool, _render_pool = _render_pool, None
+    if pool is not None:
+        pool.shutdown(cancel_futures=True)
+
+
 def ensure_output_dirs():
     """Ensure output directories exist."""
     (OUTPUT_DIR / "pro_obaa").mkdir(parents=True, exist_ok=True)
@@ -98,9 +161,19 @@ def ensure_output_dirs():
     (OUTPUT_DIR / "llm_generated").mkdir(parents=True, exist_ok=True)
 
 
-def generate_filename(meme: GeneratedMeme, index: int) -> str:
-    """Generate a unique filename for a meme."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+def batch_timestamp() -> str:
+    """Timestamp shared by every filename in one rendered batch."""
+    return datetime.now().strftime("%Y%m%d_%H%M%S")
+
+
+def generate_filename(meme: GeneratedMeme, index: int, timestamp: Optional[str] = None) -> str:
+    """Generate a unique filename for a meme.
+
+    The index keeps names unique within a batch; pass the batch's timestamp
+    to avoid formatting the clock once per meme.
+    """
+    if timestamp is None:
+        timestamp = batch_timestamp()
     return f"{index:02d}_{meme.template_id}_{meme.category.value}_{timestamp}.png"
 
 
@@ -118,17 +191,12 @@ def render_meme(meme: GeneratedMeme, output_path: Path) -> bool:
         print(f"Unknown template: {meme.template_id}")
         return False
 
-    config = TEMPLATE_GENERATORS[meme.template_id]
-    func = config["function"]
-    args_map = config["args_map"]
-
-    # Extract arguments in order
-    args = []
-    for arg_name in args_map:
-        value = meme.text_content.get(arg_name, "")
-        args.append(value)
+    func = TEMPLATE_GENERATORS[meme.template_id]["function"]
 
     try:
+        # Extract arguments in order, missing slots as ""
+        args = TEMPLATE_EXTRACTORS[meme.template_id](defaultdict(str, meme.text_content))
+
         # Call the generator function
         func(*args, output_path, meme.category.value)
         return True
@@ -137,6 +205,28 @@ def render_meme(meme: GeneratedMeme, output_path: Path) -> bool:
         return False
 
 
+def _render_jobs(jobs: List[Tuple[GeneratedMeme, Path]]) -> List[Path]:
+    """Render (meme, output_path) pairs, fanning out to worker processes.
+
+    Returns the paths that rendered successfully, in job order.
+    """
+    global _render_pool
+    ok = None
+    if RENDER_WORKERS > 1 and len(jobs) >= RENDER_POOL_MIN_BATCH:
+        pool = _get_render_pool()
+        try:
+            ok = list(pool.map(render_meme, *zip(*jobs)))
+        except BrokenProcessPool:
+            # A worker died; start a fresh pool next time and render inline now
+            with _render_pool_lock:
+                if _render_pool is pool:
+                    _render_pool = None
+    if ok is None:
+        ok = [render_meme(meme, path) for meme, path in jobs]
+
+    return [path for (_, path), success in zip(jobs, ok) if success]
+
+
 def render_batch(
     batch: BatchMemeOutput,
     output_subdir: Optional[str] = None
@@ -158,7 +248,14 @@ def render_batch(
     else:
         base_dir = OUTPUT_DIR / "llm_generated"
 
-    rendered_paths = []
+    # Create each category directory once, not once per meme
+    if not output_subdir:
+        for category in {meme.category.value for meme in batch.memes}:
+            (base_dir / category).mkdir(parents=True, exist_ok=True)
+
+    # Directories and filenames are settled here so workers only render
+    jobs = []
+    timestamp = batch_timestamp()
 
     for idx, meme in enumerate(batch.memes, start=1):
         # Determine output directory based on category
@@ -167,15 +264,10 @@ def render_batch(
         else:
             category_dir = base_dir / meme.category.value
 
-        category_dir.mkdir(parents=True, exist_ok=True)
-
-        filename = generate_filename(meme, idx)
-        output_path = category_dir / filename
-
-        if render_meme(meme, output_path):
-            rendered_paths.append(output_path)
+        filename = generate_filename(meme, idx, timestamp)
+        jobs.append((meme, category_dir / filename))
 
-    return rendered_paths
+    return _render_jobs(jobs)
 
 
 def render_memes_by_category(
@@ -198,6 +290,7 @@ def render_memes_by_category(
 
     pro_idx = 1
     anti_idx = 1
+    timestamp = batch_timestamp()
 
     for meme in batch.memes:
         if meme.category == MemeCategory.PRO_OBAA:
@@ -209,7 +302,7 @@ def render_memes_by_category(
             idx = anti_idx
             anti_idx += 1
 
-        filename = generate_filename(meme, idx)
+        filename = generate_filename(meme, idx, timestamp)
         output_path = output_dir / filename
 
         if render_meme(meme, output_path):
@@ -257,7 +350,8 @@ class MemeRenderer:
         )
 
         batch = await self.pipeline.generate_batch(request)
-        paths = render_batch(batch)
+        # render_batch blocks while its worker processes run; keep the loop free
+        paths = await asyncio.to_thread(render_batch, batch)
 
         return {
             "memes": batch.memes,
@@ -279,12 +373,13 @@ class MemeRenderer:
         Returns:
             Dict with rendered paths organized by category
         """
+        # Both categories are generated concurrently inside the pipeline
         batch = await self.pipeline.generate_for_both_categories(
             templates=templates,
             num_per_category=num_per_category,
         )
 
-        return render_memes_by_category(batch)
+        return await asyncio.to_thread(render_memes_by_category, batch)
 
 
 # Utility function for quick rendering
@@ -1,7 +1,8 @@
 """Pydantic models for structured LLM outputs and pipeline data."""
 
-from pydantic import BaseModel, Field
-from typing import List, Optional, Literal
+from functools import lru_cache
+from pydantic import BaseModel, Field, create_model
+from typing import ClassVar, List, Optional, Literal, Type
 from enum import Enum
 
 
@@ -116,6 +117,33 @@ class BatchMemeOutput(BaseModel):
     memes: List[GeneratedMeme]
     total_generated: int
     category_breakdown: dict  # {"pro_obaa": 10, "anti_sinners": 10}
+    errors: List[str] = Field(default_factory=list)  # Per-template failures
+
+
+# === Marshaled Output Models ===
+
+class MarshaledOutput(BaseModel):
+    """Several slot sets for one template, returned by a single LLM call.
+
+    Concrete subclasses come from marshaled_output_model() and add a typed
+    `memes` list; the list sits under an object because structured outputs
+    require an object at the top level.
+    """
+    item_model: ClassVar[Type[BaseModel]]
+    batch_size: ClassVar[int] = 1
+
+
+@lru_cache(maxsize=None)
+def marshaled_output_model(item_model: Type[BaseModel], batch_size: int) -> Type[MarshaledOutput]:
+    """Build the response model for `batch_size` variations of one template."""
+    model = create_model(
+        f"{item_model.__name__}x{batch_size}",
+        __base__=MarshaledOutput,
+        memes=(List[item_model], Field(..., description=f"Exactly {batch_size} distinct variations")),
+    )
+    model.item_model = item_model
+    model.batch_size = batch_size
+    return model
 
 
 # === Comment Analysis Models ===
@@ -152,6 +180,7 @@ class MemeGenerationRequest(BaseModel):
     # Template selection
     templates: Optional[List[str]] = None  # If None, use all templates
     num_memes: int = Field(default=10, ge=1, le=50)
+    batch_size: int = Field(default=4, ge=1, le=16)  # Variations of one template per LLM call
 
     # Content guidance
     custom_themes: Optional[List[str]] = None  # e.g., ["oscar nominations", "acting"]
@@ -1,7 +1,8 @@
 """Main meme generation pipeline using LLM."""
 
 import asyncio
-from typing import List, Optional, Type, Any
+from itertools import cycle, islice
+from typing import List, Optional, Tuple, Type, Any
 from pydantic import BaseModel
 
 from .models import (
@@ -20,6 +21,7 @@ from .models import (
     WantHoldingOutput,
     TwoButtonsOutput,
     MJCryingOutput,
+    marshaled_output_model,
 )
 from .templates import MEME_TEMPLATES, get_template
 from .prompts import get_full_system_prompt, build_user_prompt
@@ -46,13 +48,19 @@ TEMPLATE_OUTPUT_MODELS = {
 class MemeGenerationPipeline:
     """Main pipeline for LLM-powered meme generation."""
 
-    def __init__(self, llm_client: Any, comment_db: Optional[CommentDatabase] = None):
+    def __init__(
+        self,
+        llm_client: Any,
+        comment_db: Optional[CommentDatabase] = None,
+    ):
         """Initialize the pipeline.
 
         Args:
             llm_client: An object with an async _call_llm method matching the signature:
                        async def _call_llm(self, model, system_prompt, user_prompt, response_format)
             comment_db: CommentDatabase instance. Creates default if not provided.
+                       Concurrency limits belong to the client, which may be
+                       shared by several pipelines.
         """
         self.llm = llm_client
         self.comments = comment_db or CommentDatabase()
@@ -151,28 +159,16 @@ class MemeGenerationPipeline:
             campaign_goal=goal,
         )
 
-    async def generate_meme(
+    def _build_prompts(
         self,
         template_id: str,
         category: MemeCategory,
         context: MemeContext,
-        target_movie: str = "One Battle After Another",
-        competitor_movie: str = "Sinners",
-    ) -> GeneratedMeme:
-        """Generate a single meme using the LLM.
-
-        Args:
-            template_id: ID of the meme template to use
-            category: PRO_OBAA or ANTI_SINNERS
-            context: MemeContext with comments and themes
-            target_movie: Movie to promote
-            competitor_movie: Movie to contrast against
-
-        Returns:
-            GeneratedMeme with text content and metadata
-        """
+        target_movie: str,
+        competitor_movie: str,
+    ) -> Tuple[str, str]:
+        """Build the system and user prompts for a template."""
         template = get_template(template_id)
-        response_model = self._get_output_model(template_id)
 
         # Build prompts
         system_prompt = get_full_system_prompt(template_id)
@@ -195,14 +191,16 @@ class MemeGenerationPipeline:
             key_themes=context.key_themes,
         )
 
-        # Call the LLM
-        result = await self.llm._call_llm(
-            model="gpt-4o-mini",
-            system_prompt=system_prompt,
-            user_prompt=user_prompt,
-            response_format=response_model,
-        )
+        return system_prompt, user_prompt
 
+    def _to_generated_meme(
+        self,
+        result: BaseModel,
+        template_id: str,
+        category: MemeCategory,
+        context: MemeContext,
+    ) -> GeneratedMeme:
+        """Wrap a structured LLM result as a GeneratedMeme."""
         # Extract text content and calculate confidence
         text_content = self._extract_text_content(result, template_id)
         confidence = self._calculate_confidence(result, template_id)
@@ -219,12 +217,98 @@ class MemeGenerationPipeline:
             reasoning=reasoning,
         )
 
+    async def generate_meme(
+        self,
+        template_id: str,
+        category: MemeCategory,
+        context: MemeContext,
+        target_movie: str = "One Battle After Another",
+        competitor_movie: str = "Sinners",
+    ) -> GeneratedMeme:
+        """Generate a single meme using the LLM.
+
+        Args:
+            template_id: ID of the meme template to use
+            category: PRO_OBAA or ANTI_SINNERS
+            context: MemeContext with comments and themes
+            target_movie: Movie to promote
+            competitor_movie: Movie to contrast against
+
+        Returns:
+            GeneratedMeme with text content and metadata
+        """
+        response_model = self._get_output_model(template_id)
+        system_prompt, user_prompt = self._build_prompts(
+            template_id, category, context, target_movie, competitor_movie
+        )
+
+        # Call the LLM
+        result = await self.llm._call_llm(
+            model="gpt-4o-mini",
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            response_format=response_model,
+        )
+
+        return self._to_generated_meme(result, template_id, category, context)
+
+    async def generate_variations(
+        self,
+        template_id: str,
+        count: int,
+        category: MemeCategory,
+        context: MemeContext,
+        target_movie: str = "One Battle After Another",
+        competitor_movie: str = "Sinners",
+    ) -> List[GeneratedMeme]:
+        """Generate several memes for one template in a single LLM call.
+
+        Args:
+            template_id: ID of the meme template to use
+            count: Number of distinct variations to request
+            category: PRO_OBAA or ANTI_SINNERS
+            context: MemeContext with comments and themes
+            target_movie: Movie to promote
+            competitor_movie: Movie to contrast against
+
+        Returns:
+            Up to `count` GeneratedMemes, depending on how many the LLM returned
+        """
+        if count == 1:
+            return [await self.generate_meme(
+                template_id, category, context, target_movie, competitor_movie
+            )]
+
+        response_model = marshaled_output_model(self._get_output_model(template_id), count)
+        system_prompt, user_prompt = self._build_prompts(
+            template_id, category, context, target_movie, competitor_movie
+        )
+        user_prompt += (
+            f"\n\nGenerate {count} distinct variations of this meme and return them "
+            f"in the `memes` list. Each variation must use a different joke."
+        )
+
+        result = await self.llm._call_llm(
+            model="gpt-4o-mini",
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            response_format=response_model,
+        )
+
+        return [
+            self._to_generated_meme(item, template_id, category, context)
+            for item in result.memes[:count]
+        ]
+
     async def generate_batch(
         self,
         request: MemeGenerationRequest
     ) -> BatchMemeOutput:
         """Generate a batch of memes based on user request.
 
+        Repeats of the same template are marshaled into one LLM call of up to
+        `request.batch_size` variations instead of one call per meme.
+
         Args:
             request: MemeGenerationRequest with category and options
 
@@ -234,31 +318,51 @@ class MemeGenerationPipeline:
         # Build context from database
         context = await self._build_context(request)
 
-        # Select templates
+        # Select templates, cycling through them to reach the requested number
         templates = request.templates or list(MEME_TEMPLATES.keys())
+        templates = list(islice(cycle(templates), request.num_memes))
 
-        # Limit to requested number
-        if len(templates) > request.num_memes:
-            templates = templates[:request.num_memes]
+        # Count memes per template (first-seen order), then split into chunks
+        counts = {}
+        for template_id in templates:
+            counts[template_id] = counts.get(template_id, 0) + 1
 
-        # Generate memes concurrently
+        chunks = []
+        for template_id, count in counts.items():
+            for start in range(0, count, request.batch_size):
+                chunks.append((template_id, min(request.batch_size, count - start)))
+
+        # Generate chunks concurrently; the LLM client bounds requests in flight
         tasks = [
-            self.generate_meme(
+            self.generate_variations(
                 template_id=template_id,
+                count=count,
                 category=request.category,
                 context=context,
                 target_movie=request.target_movie,
                 competitor_movie=request.competitor_movie,
             )
-            for template_id in templates
+            for template_id, count in chunks
         ]
 
-        memes = await asyncio.gather(*tasks)
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        # One failed chunk shouldn't discard the rest of the batch
+        memes = []
+        errors = []
+        for (template_id, count), result in zip(chunks, results):
+            if isinstance(result, Exception):
+                errors.append(f"{template_id}: {result}")
+                continue
+            memes.extend(result)
+            if len(result) < count:
+                errors.append(f"{template_id}: expected {count} variations, got {len(result)}")
 
         return BatchMemeOutput(
-            memes=list(memes),
+            memes=memes,
             total_generated=len(memes),
             category_breakdown={request.category.value: len(memes)},
+            errors=errors,
         )
 
     async def generate_for_both_categories(
@@ -305,4 +409,5 @@ class MemeGenerationPipeline:
                 MemeCategory.PRO_OBAA.value: len(pro_batch.memes),
                 MemeCategory.ANTI_SINNERS.value: len(anti_batch.memes),
             },
+            errors=pro_batch.errors + anti_batch.errors,
         )
@@ -1,5 +1,7 @@
 """System prompts and template-specific prompts for meme generation."""
 
+from functools import lru_cache
+
 MEME_GENERATION_SYSTEM_PROMPT = """You are a meme content generator specializing in film criticism humor for the Oscar season.
 
 Your task is to generate meme text that:
@@ -163,11 +165,21 @@ def get_template_prompt(template_id: str) -> str:
     return TEMPLATE_SPECIFIC_PROMPTS[template_id]
 
 
+@lru_cache(maxsize=64)
 def get_full_system_prompt(template_id: str) -> str:
-    """Get the combined system prompt for a specific template."""
+    """Get the combined system prompt for a specific template.
+
+    Cached per template; unknown ids raise KeyError and are not cached.
+    """
     return MEME_GENERATION_SYSTEM_PROMPT + "\n\n" + TEMPLATE_SPECIFIC_PROMPTS[template_id]
 
 
+def _bullets(comments: list) -> str:
+    """Format the first five comments as a dash list, one per line."""
+    top = comments[:5]
+    return "- " + "\n- ".join(top) if top else ""
+
+
 def build_user_prompt(
     template: dict,
     category: str,
@@ -178,25 +190,27 @@ def build_user_prompt(
     key_themes: list,
 ) -> str:
     """Build the user prompt with all context for meme generation."""
+    positive = _bullets(positive_comments)
+    negative = _bullets(negative_comments)
 
     # Determine campaign goal
     if category == "pro_obaa":
         goal = f"Boost {target_movie} - make it look amazing, celebrate its qualities"
         comment_context = f"""
 POSITIVE COMMENTS about {target_movie} to draw from:
-{chr(10).join('- ' + c for c in positive_comments[:5])}
+{positive}
 
 NEGATIVE COMMENTS about {competitor_movie} for contrast:
-{chr(10).join('- ' + c for c in negative_comments[:5])}
+{negative}
 """
     else:  # anti_sinners
         goal = f"Undermine {competitor_movie} - mock the hype, question the quality"
         comment_context = f"""
 NEGATIVE COMMENTS about {competitor_movie} to draw from:
-{chr(10).join('- ' + c for c in negative_comments[:5])}
+{negative}
 
 POSITIVE COMMENTS about {target_movie} for contrast:
-{chr(10).join('- ' + c for c in positive_comments[:5])}
+{positive}
 """
 
     return f"""Generate meme text for the "{template['name']}" template.
@@ -47,8 +47,7 @@ class CodeGenerationAgent(BaseTemplateAgent[GeneratedCode]):
     wrapped_approve = wrap_text(approve_text, font, text_width, draw)
     draw_outlined_text(draw, (text_x, height * 3 // 4 - 30), wrapped_approve, font)
 
-    template.save(output_path)
-    print(f"Created: {output_path}")'''
+    save_meme(template, output_path)'''
 
     @property
     def name(self) -> str:
@@ -139,7 +138,7 @@ Requirements:
 - Use font size {slots.font_size_recommendation if slots else 32}
 - Position text according to the slot positions provided
 - Use wrap_text() and draw_outlined_text() helpers
-- Save to output_path and print creation message
+- Save with save_meme(template, output_path)
 
 ## TASK 3: TEMPLATE_GENERATORS ENTRY
 
@@ -9,6 +9,10 @@ class ImageDimensions(BaseModel):
     width: int = Field(..., description="Image width in pixels")
     height: int = Field(..., description="Image height in pixels")
 
+    def scaled(self, factor: float) -> "ImageDimensions":
+        """Dimensions multiplied by factor."""
+        return ImageDimensions(width=round(self.width * factor), height=round(self.height * factor))
+
 
 class TextPosition(BaseModel):
     """Position and dimensions for a text slot."""
@@ -60,6 +64,22 @@ class SlotDetection(BaseModel):
         default=32, description="Recommended font size based on template"
     )
 
+    def scaled(self, factor: float) -> "SlotDetection":
+        """Copy with text positions and font size multiplied by factor."""
+        positions = [
+            pos.model_copy(update={
+                "x": round(pos.x * factor),
+                "y": round(pos.y * factor),
+                "width": round(pos.width * factor),
+                "height": round(pos.height * factor),
+            })
+            for pos in self.text_positions
+        ]
+        return self.model_copy(update={
+            "text_positions": positions,
+            "font_size_recommendation": round(self.font_size_recommendation * factor),
+        })
+
 
 class IronyAnalysis(BaseModel):
     """Output from Irony Analysis Agent (DEDICATED for capturing humor)."""
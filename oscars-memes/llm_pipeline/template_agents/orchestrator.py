@@ -78,11 +78,15 @@ class TemplateOrchestrator:
     async def process(
         self,
         image_path: str,
+        scale: float = 1.0,
     ) -> TemplateProcessingResult:
         """Process a template image through all agents.
 
         Args:
             image_path: Path to the template image file.
+            scale: Ratio of the final template's size to image_path's, when
+                the agents look at a downscaled copy. Detected slot positions
+                are mapped back to the final template's pixels.
 
         Returns:
             TemplateProcessingResult with all agent outputs.
@@ -102,6 +106,8 @@ class TemplateOrchestrator:
             image_path,
             visual_analysis=visual,
         )
+        if scale != 1.0:
+            slots, visual = self._rescale(slots, visual, scale)
         if self.on_stage_complete:
             self.on_stage_complete("slots", slots)
 
@@ -171,14 +177,28 @@ class TemplateOrchestrator:
 
         return result
 
+    @staticmethod
+    def _rescale(
+        slots: SlotDetection,
+        visual: VisualAnalysis,
+        scale: float,
+    ) -> tuple[SlotDetection, VisualAnalysis]:
+        """Map slot positions and image size from the analysed copy to the final template."""
+        visual = visual.model_copy(update={
+            "image_dimensions": visual.image_dimensions.scaled(scale),
+        })
+        return slots.scaled(scale), visual
+
     async def process_with_updates(
         self,
         image_path: str,
+        scale: float = 1.0,
     ) -> AsyncGenerator[ProcessingUpdate, None]:
         """Process template with streaming status updates.
 
         Args:
             image_path: Path to the template image file.
+            scale: Ratio of the final template's size to image_path's (see process).
 
         Yields:
             ProcessingUpdate objects as each stage completes.
@@ -214,6 +234,8 @@ class TemplateOrchestrator:
                         image_path,
                         visual_analysis=results.get("visual"),
                     )
+                    if scale != 1.0:
+                        result, results["visual"] = self._rescale(result, results["visual"], scale)
                 elif stage_id == "irony":
                     result = await self.irony_agent.run(
                         image_path,
@@ -290,14 +312,15 @@ class TemplateOrchestrator:
             progress_percent=100,
         )
 
-    def process_sync(self, image_path: str) -> TemplateProcessingResult:
+    def process_sync(self, image_path: str, scale: float = 1.0) -> TemplateProcessingResult:
         """Synchronous version of process for simpler usage.
 
         Args:
             image_path: Path to the template image file.
+            scale: Ratio of the final template's size to image_path's (see process).
 
         Returns:
             TemplateProcessingResult with all agent outputs.
         """
         import asyncio
-        return asyncio.run(self.process(image_path))
+        return asyncio.run(self.process(image_path, scale=scale))
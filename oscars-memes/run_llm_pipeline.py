@@ -21,6 +21,7 @@ from llm_pipeline import (
     CommentDatabase,
     MemeGenerationRequest,
     MemeCategory,
+    MarshaledOutput,
     MEME_TEMPLATES,
 )
 from llm_pipeline.generator import MemeRenderer, quick_render
@@ -40,6 +41,11 @@ class MockLLMClient:
     async def _call_llm(self, model, system_prompt, user_prompt, response_format):
         """Mock LLM call that returns example responses based on template."""
 
+        # Marshaled requests ask for several variations of one template
+        if issubclass(response_format, MarshaledOutput):
+            mock = await self._call_llm(model, system_prompt, user_prompt, response_format.item_model)
+            return response_format(memes=[mock] * response_format.batch_size)
+
         # Get the field names from the response model
         fields = response_format.model_fields.keys()
 